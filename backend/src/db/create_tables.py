@@ -2,29 +2,95 @@
 Script for creating database tables.
 """
 
+import argparse
+from typing import Optional
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ProgrammingError
+
 from ..utils.logger import app_logger
 from .create_db import create_database
 from .database import get_engine
-from .models import Base
+from .models import SCHEMA_VERSION, Base, schema_version
+
+
+def get_schema_version(engine: Engine) -> Optional[int]:
+    """
+    Read the currently applied schema version.
 
+    Args:
+        engine: SQLAlchemy engine instance
 
-def create_tables() -> None:
+    Returns:
+        Optional[int]: The applied schema version, or None if no schema is recorded
+    """
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(schema_version.c.version))).scalar()
+    except ProgrammingError:
+        # The schema_version table doesn't exist yet
+        return None
+
+
+def create_tables(rebuild: bool = False) -> None:
     """
     Create database tables based on SQLAlchemy models.
+
+    Table creation is skipped when the recorded schema version is current, so a
+    normal boot costs a single indexed SELECT instead of one probe per table.
+
+    create_all never alters existing tables, so tables from an older schema
+    version are not upgraded in place. They are refused unless rebuild is set,
+    which drops them and all their data first.
+
+    Args:
+        rebuild: Drop and recreate the tables if they use an older schema
+
+    Raises:
+        Exception: If the tables use an older schema and rebuild is not set, or if
+            creating them fails
     """
     try:
         # First ensure the database exists
         create_database()
 
-        # Create tables
         engine = get_engine()
-        Base.metadata.create_all(bind=engine)
-        app_logger.info("Database tables created successfully")
+        current_version = get_schema_version(engine)
+        if current_version is not None and current_version >= SCHEMA_VERSION:
+            app_logger.info("Database schema is up to date (v%s)", current_version)
+            return
+
+        # Tables without a current version row predate the present schema
+        existing = set(inspect(engine).get_table_names())
+        outdated = existing & (set(Base.metadata.tables) - {schema_version.name})
+        if outdated and not rebuild:
+            raise Exception(
+                f"Database schema is v{current_version or 0}, expected "
+                f"v{SCHEMA_VERSION}. Back up the data, then rerun with --rebuild "
+                "to drop and recreate the tables."
+            )
+
+        with engine.begin() as conn:
+            if outdated:
+                app_logger.warning(
+                    "Dropping tables from schema v%s", current_version or 0
+                )
+                Base.metadata.drop_all(bind=conn, checkfirst=True)
+            Base.metadata.create_all(bind=conn, checkfirst=True)
+            conn.execute(schema_version.insert().values(version=SCHEMA_VERSION))
+        app_logger.info("Database tables created successfully (v%s)", SCHEMA_VERSION)
 
     except Exception as e:
-        app_logger.error(f"Error creating tables: {str(e)}")
+        app_logger.error("Error creating tables: %s", e)
         raise Exception(f"Error creating tables: {str(e)}") from e
 
 
 if __name__ == "__main__":
-    create_tables()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="drop and recreate tables left by an older schema version (loses data)",
+    )
+    create_tables(rebuild=parser.parse_args().rebuild)
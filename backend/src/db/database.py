@@ -2,18 +2,43 @@
 Module for database connection and session management.
 """
 
-from typing import Any
+from typing import AsyncIterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import MetaData, create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import QueuePool
 
 from ..utils.config import app_settings
 
+# Deterministic constraint names so Alembic autogenerate produces stable diffs
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+
+class Base(DeclarativeBase):
+    """Declarative base class for all ORM models."""
+
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
+
+
 # Global engine instance for connection reuse
 _engine: Engine | None = None
-Base: Any = declarative_base()
+
+# Async engine and session factory used by handlers that await their queries
+_async_engine: AsyncEngine | None = None
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
 
 def get_engine() -> Engine:
@@ -28,18 +53,50 @@ def get_engine() -> Engine:
         _engine = create_engine(
             app_settings.DB_URL,
             poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,  # Connection health check
-            pool_recycle=3600,  # Prevent stale connections
+            pool_size=app_settings.DB_POOL_SIZE,
+            max_overflow=app_settings.DB_MAX_OVERFLOW,
+            pool_timeout=app_settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=app_settings.DB_POOL_PRE_PING,  # Survive MySQL restarts
+            pool_use_lifo=True,  # Keep the hot subset of connections warm
+            pool_recycle=app_settings.DB_POOL_RECYCLE,  # Prevent stale connections
+            pool_reset_on_return="rollback",
             connect_args={"connect_timeout": 5},
+            insertmanyvalues_page_size=1000,  # Rows per batched INSERT statement
         )
     return _engine
 
 
+def get_async_engine() -> AsyncEngine:
+    """
+    Create or return the existing async database engine.
+
+    Uses the same pool sizing as the sync engine, over the aiomysql driver.
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine instance
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            app_settings.ASYNC_DB_URL,
+            pool_size=app_settings.DB_POOL_SIZE,
+            max_overflow=app_settings.DB_MAX_OVERFLOW,
+            pool_timeout=app_settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=app_settings.DB_POOL_PRE_PING,
+            pool_use_lifo=True,
+            pool_recycle=app_settings.DB_POOL_RECYCLE,
+            pool_reset_on_return="rollback",
+            connect_args={"connect_timeout": 5},
+            insertmanyvalues_page_size=1000,
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
 def setup_database() -> None:
     """Initialize database connection."""
-    get_engine()
+    # Request handlers only use the async engine; the sync one is for schema tools
+    get_async_engine()
 
 
 def cleanup_database() -> None:
@@ -50,26 +107,20 @@ def cleanup_database() -> None:
         _engine = None
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False)
-
-
-def get_db():
+async def get_async_db() -> AsyncIterator[AsyncSession]:
     """
-    Database session dependency for FastAPI.
+    Async database session dependency for FastAPI.
 
     Yields:
-        Session: SQLAlchemy session object
+        AsyncSession: SQLAlchemy async session object
     """
-    engine = get_engine()
-    SessionLocal.configure(bind=engine)
-    session = SessionLocal()
-    try:
-        yield session
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    get_async_engine()
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
 
 
 def init_db() -> None:
@@ -80,3 +131,11 @@ def init_db() -> None:
 def cleanup_db() -> None:
     """Cleanup database connections for application shutdown."""
     cleanup_database()
+
+
+async def cleanup_async_db() -> None:
+    """Dispose of the async engine's connections for application shutdown."""
+    global _async_engine
+    if _async_engine:
+        await _async_engine.dispose()
+        _async_engine = None
@@ -2,36 +2,143 @@
 Database models for the PulseCheck team activity tracker.
 """
 
+import base64
+import binascii
 from datetime import datetime
-from typing import List, Optional
+from enum import IntEnum
+from typing import Any, List, Optional, Type
 
 from sqlalchemy import (
+    BINARY,
+    TIMESTAMP,
     Boolean,
     Column,
     DateTime,
-    Enum,
-    Float,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Table,
     Text,
+    TypeDecorator,
     UniqueConstraint,
-    func,
+    text,
 )
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import FetchedValue
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
 
 
+class InvitationStatus(IntEnum):
+    """Status of a team invitation, stored as a small integer."""
+
+    PENDING = 0
+    ACCEPTED = 1
+    REJECTED = 2
+    EXPIRED = 3
+
+
+class IntEnumType(TypeDecorator):
+    """
+    Stores a Python IntEnum as an unsigned TINYINT (SMALLINT on other databases).
+
+    Args:
+        enum_class: The IntEnum class values are converted to and from
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[IntEnum], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.TINYINT(unsigned=True))
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.enum_class(value)
+
+
+class TokenBinary(TypeDecorator):
+    """
+    Stores a secrets.token_urlsafe(32) token as its raw 32 bytes in BINARY(32).
+
+    Binary storage halves the index size and compares with a plain memcmp instead
+    of a collation-aware string comparison. Values that are not well-formed tokens
+    bind as NULL, so lookups with them simply match nothing.
+    """
+
+    impl = BINARY(32)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(value + "=")
+        except (binascii.Error, TypeError, ValueError):
+            return None
+        # Reject anything that doesn't round-trip, e.g. stray non-alphabet chars
+        if len(raw) != 32 or base64.urlsafe_b64encode(raw)[:-1].decode() != value:
+            return None
+        return raw
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return base64.urlsafe_b64encode(value).rstrip(b"=").decode("ascii")
+
+
+# Timestamps are maintained by MySQL itself, so INSERT and UPDATE statements
+# carry no value or bind parameter for them
+CURRENT_TIMESTAMP = text("CURRENT_TIMESTAMP")
+CURRENT_TIMESTAMP_ON_UPDATE = text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")
+
+
+# Bump whenever a model change is incompatible with existing tables. create_all
+# never alters a table, so create_tables refuses to run against an older schema
+# until the database is rebuilt.
+# 2: BINARY(32) tokens, TINYINT invitation status, shrunk user columns and
+#    server-side timestamp defaults
+SCHEMA_VERSION = 2
+
+
+# Tracks the applied schema version so startup can skip DDL once it is current
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("applied_at", DateTime, server_default=CURRENT_TIMESTAMP),
+)
+
+
 # Association table for user-team many-to-many relationship
 team_members = Table(
     "team_members",
     Base.metadata,
-    Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
-    Column("team_id", Integer, ForeignKey("teams.id"), primary_key=True),
+    Column(
+        "user_id",
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "team_id",
+        Integer,
+        ForeignKey("teams.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
     Column("role", String(20), default="member"),
-    Column("joined_at", DateTime, default=func.now()),
+    Column("joined_at", DateTime, server_default=CURRENT_TIMESTAMP),
     Column("is_active", Boolean, default=True),
 )
 
@@ -60,25 +167,25 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    username = Column(String(100), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
-    full_name = Column(String(255), nullable=True)
-    is_active = Column(Boolean, default=True)
-    is_superuser = Column(Boolean, default=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[str] = mapped_column(String(254), unique=True, index=True)  # RFC 5321
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(60))  # bcrypt hash length
+    full_name: Mapped[Optional[str]] = mapped_column(String(255))
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
+    is_superuser: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
-    last_login = Column(DateTime, nullable=True)
+    last_login: Mapped[Optional[datetime]]
 
     # Relationships
     teams: Mapped[List["Team"]] = relationship(
-        "Team", secondary=team_members, back_populates="members"
+        "Team", secondary=team_members, back_populates="members", passive_deletes=True
     )
     activities: Mapped[List["Activity"]] = relationship(
-        "Activity", back_populates="user"
+        "Activity", back_populates="user", passive_deletes=True
     )
     sent_invitations: Mapped[List["TeamInvitation"]] = relationship(
         "TeamInvitation",
@@ -90,8 +197,12 @@ class User(Base):
         foreign_keys="[TeamInvitation.invitee_id]",
         back_populates="invitee",
     )
+    # ON DELETE CASCADE removes sessions server-side, so don't load them first
     sessions: Mapped[List["UserSession"]] = relationship(
-        "UserSession", back_populates="user", cascade="all, delete-orphan"
+        "UserSession",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -102,7 +213,7 @@ class UserSession(Base):
     Attributes:
         id (Integer): Primary key for the session
         user_id (Integer): Foreign key to User model
-        token (String): Unique session token
+        token (TokenBinary): Unique session token
         expires_at (DateTime): Session expiration timestamp
         created_at (DateTime): Timestamp when session was created
         last_active_at (DateTime): Timestamp of last activity
@@ -116,15 +227,18 @@ class UserSession(Base):
 
     __tablename__ = "user_sessions"
 
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    token = Column(String(255), unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    last_active_at = Column(DateTime, nullable=False, default=func.now())
-    ip_address = Column(String(45), nullable=True)  # IPv6 can be up to 45 chars
-    user_agent = Column(String(255), nullable=True)
-    is_active = Column(Boolean, default=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    token: Mapped[str] = mapped_column(TokenBinary, unique=True, index=True)
+    expires_at: Mapped[datetime]
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    last_active_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    # IPv6 can be up to 45 chars
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+    user_agent: Mapped[Optional[str]] = mapped_column(String(255))
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="sessions")
@@ -153,29 +267,32 @@ class Team(Base):
 
     __tablename__ = "teams"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
-    invite_code = Column(String(20), unique=True, nullable=False, index=True)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    invite_code: Mapped[str] = mapped_column(String(20), unique=True, index=True)
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_by_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
     # Relationships
     members: Mapped[List["User"]] = relationship(
-        "User", secondary=team_members, back_populates="teams"
+        "User",
+        secondary=team_members,
+        back_populates="teams",
+        passive_deletes=True,
     )
     activities: Mapped[List["Activity"]] = relationship(
-        "Activity", back_populates="team"
+        "Activity", back_populates="team", passive_deletes=True
     )
     metrics: Mapped[List["TeamMetric"]] = relationship(
-        "TeamMetric", back_populates="team"
+        "TeamMetric", back_populates="team", passive_deletes=True
     )
     invitations: Mapped[List["TeamInvitation"]] = relationship(
-        "TeamInvitation", back_populates="team"
+        "TeamInvitation", back_populates="team", passive_deletes=True
     )
 
 
@@ -200,16 +317,16 @@ class ActivityType(Base):
 
     __tablename__ = "activity_types"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    icon = Column(String(50), nullable=True)
-    color = Column(String(20), nullable=True)
-    weight = Column(Float, default=1.0, nullable=False)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    icon: Mapped[Optional[str]] = mapped_column(String(50))
+    color: Mapped[Optional[str]] = mapped_column(String(20))
+    weight: Mapped[float] = mapped_column(default=1.0)
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -244,21 +361,22 @@ class Activity(Base):
 
     __tablename__ = "activities"
 
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
-    activity_type_id = Column(
-        Integer, ForeignKey("activity_types.id"), nullable=False, index=True
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # user_id/team_id lookups are served by the composite indexes below
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"))
+    activity_type_id: Mapped[int] = mapped_column(
+        ForeignKey("activity_types.id"), index=True
     )
-    title = Column(String(255), nullable=False)
-    description = Column(Text, nullable=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
-    duration_minutes = Column(Integer, nullable=True)
-    impact_score = Column(Float, default=0.0, nullable=False)
-    is_simulated = Column(Boolean, default=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    timestamp: Mapped[datetime] = mapped_column(index=True)
+    duration_minutes: Mapped[Optional[int]]
+    impact_score: Mapped[float] = mapped_column(default=0.0)
+    is_simulated: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -268,6 +386,12 @@ class Activity(Base):
         "ActivityType", back_populates="activities"
     )
 
+    # Indexes
+    __table_args__ = (
+        Index("ix_activities_team_ts", "team_id", "timestamp"),
+        Index("ix_activities_user_ts", "user_id", "timestamp"),
+    )
+
 
 class TeamMetric(Base):
     """
@@ -278,8 +402,8 @@ class TeamMetric(Base):
         team_id (Integer): Foreign key to Team model
         metric_type (String): Type of metric (e.g., "activity_count", "collaboration_score")
         value (Float): Numerical value of the metric
-        period_start (DateTime): Start of the period for this metric
-        period_end (DateTime): End of the period for this metric
+        period_start (TIMESTAMP): Start of the period for this metric
+        period_end (TIMESTAMP): End of the period for this metric
         created_at (DateTime): Timestamp of creation
         updated_at (DateTime): Timestamp of last update
 
@@ -289,15 +413,18 @@ class TeamMetric(Base):
 
     __tablename__ = "team_metrics"
 
-    id = Column(Integer, primary_key=True)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
-    metric_type = Column(String(50), nullable=False)
-    value = Column(Float, nullable=False)
-    period_start = Column(DateTime, nullable=False)
-    period_end = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # team_id lookups are served by the uq_team_metric_period index
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"))
+    metric_type: Mapped[str] = mapped_column(String(50))
+    value: Mapped[float]
+    # TIMESTAMP is 4 bytes and stored as UTC, keeping the period index compact.
+    # Relies on explicit_defaults_for_timestamp (the MySQL 8 default).
+    period_start: Mapped[datetime] = mapped_column(TIMESTAMP)
+    period_end: Mapped[datetime] = mapped_column(TIMESTAMP)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -326,8 +453,8 @@ class TeamInvitation(Base):
         invitee_id (Integer): Foreign key to User model for the user who received the invitation,
                              can be null if invitation is by email
         invitee_email (String): Email of the invitee if not a registered user
-        status (String): Status of the invitation (pending, accepted, rejected, expired)
-        token (String): Unique token for invitation verification
+        status (InvitationStatus): Status of the invitation (pending, accepted, rejected, expired)
+        token (TokenBinary): Unique token for invitation verification
         expires_at (DateTime): Expiration timestamp for the invitation
         created_at (DateTime): Timestamp of creation
         updated_at (DateTime): Timestamp of last update
@@ -340,30 +467,34 @@ class TeamInvitation(Base):
 
     __tablename__ = "team_invitations"
 
-    id = Column(Integer, primary_key=True)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
-    inviter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    invitee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    invitee_email = Column(String(255), nullable=True)
-    status = Column(
-        Enum("pending", "accepted", "rejected", "expired", name="invitation_status"),
-        default="pending",
-        nullable=False,
+    id: Mapped[int] = mapped_column(primary_key=True)
+    team_id: Mapped[int] = mapped_column(
+        ForeignKey("teams.id", ondelete="CASCADE"), index=True
     )
-    token = Column(String(100), unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    inviter_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    invitee_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"))
+    invitee_email: Mapped[Optional[str]] = mapped_column(String(254))
+    status: Mapped[InvitationStatus] = mapped_column(
+        IntEnumType(InvitationStatus), default=InvitationStatus.PENDING
+    )
+    token: Mapped[str] = mapped_column(TokenBinary, unique=True, index=True)
+    expires_at: Mapped[datetime]
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
 
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="invitations")
     inviter: Mapped["User"] = relationship(
-        "User", foreign_keys=[inviter_id], back_populates="sent_invitations"
+        "User",
+        foreign_keys=[inviter_id],
+        back_populates="sent_invitations",
     )
     invitee: Mapped[Optional["User"]] = relationship(
-        "User", foreign_keys=[invitee_id], back_populates="received_invitations"
+        "User",
+        foreign_keys=[invitee_id],
+        back_populates="received_invitations",
     )
 
     # Constraints
@@ -387,8 +518,8 @@ class UserMetric(Base):
         team_id (Integer): Foreign key to Team model
         metric_type (String): Type of metric (e.g., "activity_score", "engagement_level")
         value (Float): Numerical value of the metric
-        period_start (DateTime): Start of the period for this metric
-        period_end (DateTime): End of the period for this metric
+        period_start (TIMESTAMP): Start of the period for this metric
+        period_end (TIMESTAMP): End of the period for this metric
         created_at (DateTime): Timestamp of creation
         updated_at (DateTime): Timestamp of last update
 
@@ -399,16 +530,21 @@ class UserMetric(Base):
 
     __tablename__ = "user_metrics"
 
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False, index=True)
-    metric_type = Column(String(50), nullable=False)
-    value = Column(Float, nullable=False)
-    period_start = Column(DateTime, nullable=False)
-    period_end = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # user_id lookups are served by the uq_user_team_metric_period index
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    team_id: Mapped[int] = mapped_column(
+        ForeignKey("teams.id", ondelete="CASCADE"), index=True
+    )
+    metric_type: Mapped[str] = mapped_column(String(50))
+    value: Mapped[float]
+    # TIMESTAMP is 4 bytes and stored as UTC, keeping the period index compact.
+    # Relies on explicit_defaults_for_timestamp (the MySQL 8 default).
+    period_start: Mapped[datetime] = mapped_column(TIMESTAMP)
+    period_end: Mapped[datetime] = mapped_column(TIMESTAMP)
+    created_at: Mapped[datetime] = mapped_column(server_default=CURRENT_TIMESTAMP)
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=CURRENT_TIMESTAMP_ON_UPDATE, server_onupdate=FetchedValue()
     )
 
     # Relationships
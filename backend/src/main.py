@@ -2,22 +2,105 @@
 Main FastAPI application for PulseCheck.
 """
 
-# import os
+import hashlib
+import json
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Dict
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
 
-from .db.create_tables import create_tables
-from .db.database import cleanup_db, init_db
+from .db.database import cleanup_async_db, cleanup_db, init_db
 from .routes import api_router
+from .services.email_service import email_service
 from .utils.config import app_settings
 from .utils.logger import app_logger
 
+# Settings are fixed for the lifetime of the process, so resolve them once
+ENV = app_settings.CURRENT_ENV.lower()
+IS_DEV = ENV == "development"
+FRONTEND_PATH = Path(app_settings.FRONTEND_BUILD_DIR).absolute()
+
+# Cache lifetimes for common static files from the Vite build
+STATIC_CACHE_SECONDS: Dict[str, int] = {
+    "favicon.ico": 86400,  # 24 hours
+    "vite.svg": 86400,  # 24 hours
+    "logo.svg": 86400,  # 24 hours
+    "manifest.json": 3600,  # 1 hour
+    "robots.txt": 86400,  # 24 hours
+}
+
+
+class FrontendStaticFiles(StaticFiles):
+    """
+    Static files app for the frontend build with per-file cache headers.
+
+    Unknown non-API paths fall back to index.html so client-side routes work.
+    index.html only changes on deploy, so it is read once and served from memory.
+    """
+
+    def __init__(self, *, directory: str, cache_control: Dict[str, int]) -> None:
+        super().__init__(directory=directory, html=True)
+        self.cache_control = cache_control
+
+        self.index_body: bytes | None = None
+        self.index_etag = ""
+        index_path = os.path.join(directory, "index.html")
+        if os.path.isfile(index_path):
+            with open(index_path, "rb") as index_file:
+                self.index_body = index_file.read()
+            self.index_etag = f'"{hashlib.md5(self.index_body).hexdigest()}"'
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Build the file response and attach the Cache-Control header."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        max_age = self.cache_control.get(os.path.basename(full_path))
+        if max_age is not None:
+            response.headers["Cache-Control"] = f"public, max-age={max_age}"
+        else:
+            response.headers["Cache-Control"] = "no-cache"  # Don't cache index.html
+        return response
+
+    def index_response(self, scope: Scope) -> Response:
+        """Serve the cached index.html, or 304 if the client copy is current."""
+        if self.index_body is None:
+            raise StarletteHTTPException(status_code=404, detail="Frontend not found")
+
+        headers = {"Cache-Control": "no-cache", "ETag": self.index_etag}
+        if Headers(scope=scope).get("if-none-match") == self.index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self.index_body, media_type="text/html", headers=headers
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve the requested file, or index.html for unmatched non-API paths."""
+        if path in (".", "index.html"):
+            return self.index_response(scope)
+
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            # Skip API paths (they should be handled by the API router)
+            if exc.status_code != 404 or path.startswith("api/"):
+                raise
+
+        return self.index_response(scope)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -33,14 +116,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
     app_logger.info("Starting up PulseCheck Service")
 
-    if app_settings.CURRENT_ENV.lower() != "development":
-        try:
-            create_tables()
-            # # Run alembic migrations
-            # os.system("alembic upgrade head")
-            # app_logger.info("Alembic migrations applied successfully.")
-        except Exception as e:
-            app_logger.error(f"Error during alembic upgrade: {str(e)}")
+    # Schema management runs out of band (python -m backend.src.db.create_tables)
+    # so workers don't race DDL on every boot.
 
     # Initialize the database connection
     init_db()
@@ -50,6 +127,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown
     app_logger.info("Shutting down PulseCheck Service")
     cleanup_db()
+    await cleanup_async_db()
+    email_service.close()
 
 
 def create_app() -> FastAPI:
@@ -65,22 +144,29 @@ def create_app() -> FastAPI:
         description="API for PulseCheck team activity tracker",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    frontend_path = Path(app_settings.FRONTEND_BUILD_DIR).absolute()
+    # The build directory only changes on deploy, so check it once at startup
+    frontend_available = FRONTEND_PATH.is_dir()
 
-    # Add a status check endpoint that's not protected by auth
-    @app.get("/status")
-    async def status_check():
-        """Status check endpoint that doesn't require authentication."""
-        return {
+    # The status payload is static per process, so serialize it up front
+    status_body = json.dumps(
+        {
             "status": "ok",
             "environment": app_settings.CURRENT_ENV,
-            "frontend_path": str(frontend_path) if frontend_path.exists() else None,
+            "frontend_path": str(FRONTEND_PATH) if frontend_available else None,
         }
+    ).encode("utf-8")
+
+    # Add a status check endpoint that's not protected by auth
+    @app.get("/status")
+    async def status_check() -> Response:
+        """Status check endpoint that doesn't require authentication."""
+        return Response(content=status_body, media_type="application/json")
 
     # Configure CORS origins
-    if app_settings.CURRENT_ENV.lower() == "development":
+    if IS_DEV:
         origins = [
             "http://localhost:5173",  # Vite default development server
             "http://localhost:8080",  # Your custom Vite port from vite.config.ts
@@ -105,77 +191,30 @@ def create_app() -> FastAPI:
     # Include the API router with /api prefix
     app.include_router(api_router, prefix="/api")
 
-    if app_settings.CURRENT_ENV.lower() != "development":
+    if not IS_DEV:
         # Mount frontend static files if they exist
-        app_logger.info(f"Frontend directory path: {frontend_path.absolute()}")
-
-        if frontend_path.exists() and frontend_path.is_dir():
-            app_logger.info(f"Mounting frontend files from {frontend_path}")
-
-        # Mount assets directory for Vite assets (usually in /assets)
-        assets_dir = frontend_path / "assets"
-        if assets_dir.exists() and assets_dir.is_dir():
-            app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-            print("Assets directory mounted successfully")
-
-        # Serve common static files from Vite build
-        static_files = {
-            "favicon.ico": 86400,  # 24 hours
-            "vite.svg": 86400,  # 24 hours
-            "logo.svg": 86400,  # 24 hours
-            "manifest.json": 3600,  # 1 hour
-            "robots.txt": 86400,  # 24 hours
-        }
-
-        for static_file, cache_time in static_files.items():
-            file_path = frontend_path / static_file
-            if file_path.exists():
-
-                @app.get(f"/{static_file}")
-                async def serve_static_file(
-                    static_file_name: str = static_file,
-                    cache_seconds: int = cache_time,
-                ):
-                    """Serve static file with appropriate cache headers."""
-                    return FileResponse(
-                        path=str(frontend_path / static_file_name),
-                        headers={"Cache-Control": f"public, max-age={cache_seconds}"},
-                    )
-
-        # Serve index.html for root path and all unmatched routes
-        @app.get("/")
-        @app.get("/{full_path:path}")
-        async def serve_frontend(request: Request, full_path: str = ""):
-            """
-            Serve the Vite frontend application for all non-API routes.
-
-            Args:
-                request: FastAPI request object
-                full_path: The requested path
-
-            Returns:
-                FileResponse: The index.html file
-
-            Raises:
-                HTTPException: If the path is an API route or if there's an error
-            """
-            # Skip API paths (they should be handled by the API router)
-            if full_path.startswith("api/"):
-                raise HTTPException(status_code=404, detail="API endpoint not found")
+        app_logger.info("Frontend directory path: %s", FRONTEND_PATH)
 
-            try:
-                index_path = frontend_path / "index.html"
-                if not index_path.exists():
-                    raise HTTPException(status_code=404, detail="Frontend not found")
+        if frontend_available:
+            app_logger.info("Mounting frontend files from %s", FRONTEND_PATH)
 
-                return FileResponse(
-                    path=str(index_path),
-                    headers={"Cache-Control": "no-cache"},  # Don't cache index.html
+            # Mount assets directory for Vite assets (usually in /assets)
+            assets_dir = FRONTEND_PATH / "assets"
+            if assets_dir.is_dir():
+                app.mount(
+                    "/assets", StaticFiles(directory=str(assets_dir)), name="assets"
                 )
-            except Exception as e:
-                error_msg = f"Error serving frontend: {str(e)}"
-                print(error_msg)
-                raise HTTPException(status_code=500, detail=error_msg)
+                print("Assets directory mounted successfully")
+
+            # Serve the frontend build (static files and SPA fallback) from one
+            # mount. Registered last so the API and status routes take precedence.
+            app.mount(
+                "/",
+                FrontendStaticFiles(
+                    directory=str(FRONTEND_PATH), cache_control=STATIC_CACHE_SECONDS
+                ),
+                name="frontend",
+            )
 
     return app
 
@@ -189,12 +228,12 @@ if __name__ == "__main__":
     import uvicorn
 
     # Run the application
-    print(app_settings.CURRENT_ENV.lower())
+    print(ENV)
     uvicorn.run(
         "backend.src.main:app",
         host=app_settings.HOST,
         port=app_settings.PORT,
-        reload=app_settings.CURRENT_ENV.lower() == "development",
+        reload=IS_DEV,
         reload_dirs=["backend"],  # Only watch the backend directory
         reload_excludes=[
             ".trunk",
@@ -1,18 +1,30 @@
 """
 Route module initialization file that exports all routers.
+
+Every ``*_route.py`` module in this package that defines a module-level
+``router`` is included automatically, in alphabetical order.
 """
 
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import Tuple
+
 from fastapi import APIRouter
 
-from .auth_route import router as auth_router
-from .team_route import router as team_router
+# Route modules discovered once at import time
+ROUTE_MODULES: Tuple[ModuleType, ...] = tuple(
+    importlib.import_module(f"{__name__}.{module_name}")
+    for module_name in sorted(info.name for info in pkgutil.iter_modules(__path__))
+    if module_name.endswith("_route")
+)
 
 # Main router that includes all sub-routers
 api_router = APIRouter()
 
-# Include all routers here
-api_router.include_router(auth_router)
-api_router.include_router(team_router)
+for _module in ROUTE_MODULES:
+    if hasattr(_module, "router"):
+        api_router.include_router(_module.router)
 
 # Export the main router
 __all__ = ["api_router"]
@@ -3,6 +3,7 @@ Authentication routes including login, registration, and email verification.
 """
 
 import os
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from fastapi import (
     APIRouter,
@@ -15,16 +16,93 @@ from fastapi import (
     Cookie,
 )
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy import exists, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
-from ..db.database import get_db
+from ..db.database import get_async_db
 from ..db import models
 from ..services.email_service import email_service
-from ..services.auth_service import auth_service
+from ..services.auth_service import BCRYPT_MAX_BYTES, auth_service
+from ..utils.cache import TTLCache
+from ..utils.config import app_settings
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Session token cookie settings, shared by login, refresh and logout
+SESSION_COOKIE_KEY = "session_token"
+SESSION_COOKIE_PARAMS: Dict[str, Any] = {
+    "httponly": True,
+    # Decided once from configuration rather than per request from the URL scheme
+    "secure": app_settings.PROTOCOL == "https",
+    "samesite": "lax",  # Adjust based on your security requirements
+}
+
+# Per-address send counters for the verification and password reset emails
+_email_send_counts: TTLCache[int] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _email_send_limited(kind: str, email: str) -> bool:
+    """
+    Count an email send request and check it against the per-minute limit.
+
+    Args:
+        kind: Which email is being requested, e.g. "verify" or "reset"
+        email: Address the email would be sent to
+
+    Returns:
+        bool: True if the address has exceeded the limit for this minute
+    """
+    count = _email_send_counts.incr((kind, email.lower()))
+    return count > app_settings.EMAIL_SEND_LIMIT_PER_MINUTE
+
+
+# Only the token and max-age vary, so the Set-Cookie attributes are built once
+_SESSION_COOKIE_ATTRS = "; Path=/; SameSite={samesite}{secure}{httponly}".format(
+    samesite=SESSION_COOKIE_PARAMS["samesite"],
+    secure="; Secure" if SESSION_COOKIE_PARAMS["secure"] else "",
+    httponly="; HttpOnly" if SESSION_COOKIE_PARAMS["httponly"] else "",
+)
+
+
+def _set_session_cookie(response: Response, value: str, expires_at: datetime) -> None:
+    """
+    Set the session token as an HttpOnly cookie.
+
+    The header is written directly because session tokens are URL-safe base64 and
+    need none of SimpleCookie's quoting.
+
+    Args:
+        response: Response to attach the cookie to
+        value: Session token
+        expires_at: When the session expires
+    """
+    max_age = int((expires_at - datetime.now(timezone.utc)).total_seconds())
+    cookie = f"{SESSION_COOKIE_KEY}={value}; Max-Age={max_age}{_SESSION_COOKIE_ATTRS}"
+    response.raw_headers.append((b"set-cookie", cookie.encode("latin-1")))
+
+
+def _check_password_bytes(password: str) -> str:
+    """
+    Reject passwords longer than bcrypt can use.
+
+    bcrypt only reads the first 72 bytes, so a longer password would have its tail
+    silently ignored. The limit is in UTF-8 bytes, not characters.
+
+    Args:
+        password: The plaintext password
+
+    Returns:
+        str: The unchanged password
+
+    Raises:
+        ValueError: If the password is longer than BCRYPT_MAX_BYTES when encoded
+    """
+    if len(password.encode("utf-8")) > BCRYPT_MAX_BYTES:
+        raise ValueError(f"Password must be at most {BCRYPT_MAX_BYTES} bytes")
+    return password
+
 
 # Pydantic models for request validation
 class UserCreate(BaseModel):
@@ -35,8 +113,10 @@ class UserCreate(BaseModel):
     password: str = Field(..., min_length=4)
     full_name: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    _check_password = field_validator("password")(_check_password_bytes)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "username": "johndoe",
@@ -44,6 +124,7 @@ class UserCreate(BaseModel):
                 "full_name": "John Doe",
             }
         }
+    )
 
 
 class EmailVerificationRequest(BaseModel):
@@ -51,8 +132,9 @@ class EmailVerificationRequest(BaseModel):
 
     email: EmailStr
 
-    class Config:
-        json_schema_extra = {"example": {"email": "user@example.com"}}
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"email": "user@example.com"}}
+    )
 
 
 class VerifyTokenRequest(BaseModel):
@@ -60,10 +142,11 @@ class VerifyTokenRequest(BaseModel):
 
     token: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."}
         }
+    )
 
 
 class LoginRequest(BaseModel):
@@ -73,21 +156,51 @@ class LoginRequest(BaseModel):
     password: str
     remember_me: bool = False
 
-    class Config:
-        json_schema_extra = {
+    _check_password = field_validator("password")(_check_password_bytes)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123",
                 "remember_me": True,
             }
         }
+    )
 
 
-@router.post(
-    "/register", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any]
-)
+# Pydantic models for response serialization
+class UserOut(BaseModel):
+    """Public user fields, read straight from ORM objects or rows."""
+
+    id: int
+    email: str
+    username: str
+    full_name: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CurrentUserOut(UserOut):
+    """User fields returned by /me."""
+
+    is_active: bool
+    created_at: datetime
+
+
+class LoginResponse(BaseModel):
+    """Login response model."""
+
+    message: str
+    access_token: str
+    token_type: str
+    user: UserOut
+
+
+@router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register_user(
-    user_data: UserCreate, request: Request, db: Session = Depends(get_db)
+    user_data: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Register a new user and send verification email.
@@ -109,7 +222,7 @@ async def register_user(
         - 201 Created: Object containing:
             - message: "User registered successfully"
             - user_id: Integer - ID of the newly created user
-            - verification_email_sent: Boolean - Whether the verification email was sent
+            - verification_email_sent: Boolean - Whether the verification email was queued
             - verification_required: Boolean - Whether email verification is required
         - 400 Bad Request: If email is already registered or username is taken
         - 422 Unprocessable Entity: If the request body is invalid
@@ -139,24 +252,31 @@ async def register_user(
         - The user will not be able to log in until they verify their email
         - You may want to provide a way for users to request a new verification email
     """
-    # Check if user with this email already exists
-    if db.query(models.User).filter(models.User.email == user_data.email).first():
+    # Check email and username with two EXISTS probes in one round trip, before
+    # paying for the hash
+    email_taken, username_taken = (
+        await db.execute(
+            select(
+                exists().where(models.User.email == user_data.email),
+                exists().where(models.User.username == user_data.username),
+            )
+        )
+    ).one()
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
-
-    # Check if username is taken
-    if db.query(models.User).filter(models.User.username == user_data.username).first():
+    if username_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
         )
 
-    # Create user (you would typically hash the password here)
-    from passlib.context import CryptContext
+    # End the read transaction so the pooled connection is not held while hashing;
+    # the session checks out a connection again for the INSERT
+    await db.rollback()
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-    hashed_password = pwd_context.hash(user_data.password)
+    # Hash the password
+    hashed_password = await auth_service.hash_password_async(user_data.password)
 
     # Create new user with is_active=False until email is verified
     new_user = models.User(
@@ -168,29 +288,42 @@ async def register_user(
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        # A concurrent registration won the race; the unique indexes caught it
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                "Email already registered"
+                if "ix_users_email" in str(e.orig)
+                else "Username already taken"
+            ),
+        )
+    await db.refresh(new_user)
 
     # Generate verification token
     verification_token = auth_service.create_verification_token(user_data.email)
 
-    # Send verification email
-    email_sent = email_service.send_verification_email(
-        user_data.email, verification_token
+    # Send verification email on the email worker threads; failures are logged
+    email_service.send_in_background(
+        email_service.send_verification_email, user_data.email, verification_token
     )
 
     # Return response
     return {
         "message": "User registered successfully",
         "user_id": new_user.id,
-        "verification_email_sent": email_sent,
+        "verification_email_sent": True,
         "verification_required": True,
     }
 
 
-@router.post("/send-verification-email", response_model=Dict[str, Any])
+@router.post("/send-verification-email")
 async def send_verification_email(
-    verification_data: EmailVerificationRequest, db: Session = Depends(get_db)
+    verification_data: EmailVerificationRequest,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Send or resend a verification email to the specified email address.
@@ -207,7 +340,7 @@ async def send_verification_email(
     Returns:
         - 200 OK: Object containing:
             - message: String - Status message
-            - email_sent: Boolean - Whether the email was sent successfully
+            - email_sent: Boolean - Whether the email was queued for sending
         - 404 Not Found: If no user with the provided email exists
         - 422 Unprocessable Entity: If the request body is invalid
 
@@ -229,12 +362,19 @@ async def send_verification_email(
     Notes for Frontend Developers:
         - This endpoint is useful for implementing a "Resend verification email" feature
         - Display appropriate feedback to the user about checking their inbox
+        - Repeated requests for the same address within a minute return 200 with
+          email_sent false and no email is sent
     """
+    # Past the per-minute limit, answer without touching the database or SMTP
+    if _email_send_limited("verify", verification_data.email):
+        return {
+            "message": "A verification email was sent recently, please check your inbox",
+            "email_sent": False,
+        }
+
     # Check if user exists
-    user = (
-        db.query(models.User)
-        .filter(models.User.email == verification_data.email)
-        .first()
+    user = await db.scalar(
+        select(models.User.id).where(models.User.email == verification_data.email)
     )
     if not user:
         raise HTTPException(
@@ -244,23 +384,23 @@ async def send_verification_email(
     # Generate verification token
     verification_token = auth_service.create_verification_token(verification_data.email)
 
-    # Send verification email
-    email_sent = email_service.send_verification_email(
-        verification_data.email, verification_token
+    # Send verification email on the email worker threads; failures are logged
+    email_service.send_in_background(
+        email_service.send_verification_email,
+        verification_data.email,
+        verification_token,
     )
 
     return {
-        "message": (
-            "Verification email sent successfully"
-            if email_sent
-            else "Failed to send verification email"
-        ),
-        "email_sent": email_sent,
+        "message": "Verification email sent successfully",
+        "email_sent": True,
     }
 
 
-@router.post("/verify-email", response_model=Dict[str, Any])
-async def verify_email(verify_data: VerifyTokenRequest, db: Session = Depends(get_db)):
+@router.post("/verify-email")
+async def verify_email(
+    verify_data: VerifyTokenRequest, db: AsyncSession = Depends(get_async_db)
+):
     """
     Verify a user's email address using the verification token.
 
@@ -300,61 +440,41 @@ async def verify_email(verify_data: VerifyTokenRequest, db: Session = Depends(ge
         - After successful verification, guide the user to the login page
         - Consider displaying a message explaining that their account is now active
     """
-    try:
-        # Verify token and get email
-        token_result = auth_service.verify_token(verify_data.token)
-
-        # Handle the case where verify_token returns a tuple (success, email)
-        email = None
-        if isinstance(token_result, tuple) and len(token_result) == 2:
-            success, email = token_result
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid or expired token",
-                )
-        else:
-            # If it's not a tuple, assume it's just the email string
-            email = token_result
-
-        if not email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid or expired token",
-            )
-
-        # Find user by email
-        user = db.query(models.User).filter(models.User.email == email).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
-        # Activate user account
-        user.is_active = True
-        db.commit()
-
-        return {"message": "Email verified successfully", "verified": True}
-    except Exception as e:
+    # Verify token and get email
+    email = auth_service.verify_token(verify_data.token)
+    if not email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Verification failed: {str(e)}",
+            detail="Invalid or expired token",
         )
 
+    # Activate the user's account in a single UPDATE (MySQL has no RETURNING,
+    # so the matched row count tells us whether the user exists)
+    result = await db.execute(
+        update(models.User).where(models.User.email == email).values(is_active=True)
+    )
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    return {"message": "Email verified successfully", "verified": True}
 
-@router.post("/login", response_model=Dict[str, Any])
+
+@router.post("/login", response_model=LoginResponse)
 async def login(
     login_data: LoginRequest,
+    request: Request,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Log in a user with email and password.
 
     This endpoint authenticates a user with their email and password, and if successful,
-    returns an access token and sets a refresh token cookie. The access token should be
-    used for authenticated API requests, while the refresh token is used to obtain new
-    access tokens when they expire.
+    starts a server-side session. The session token is returned as the access token
+    for the Authorization header and is also set as an HTTP-only cookie.
 
     Authentication:
         - No authentication required
@@ -362,12 +482,12 @@ async def login(
     Request Body:
         - email: String (required) - User's email address
         - password: String (required) - User's password
-        - remember_me: Boolean (optional) - Whether to extend token validity periods
+        - remember_me: Boolean (optional) - Whether to extend the session lifetime
 
     Returns:
         - 200 OK: Object containing:
             - message: String - Success message
-            - access_token: String - JWT access token for API authorization
+            - access_token: String - Session token for API authorization
             - token_type: String - Type of token (always "bearer")
             - user: Object - User information including:
                 - id: Integer - User ID
@@ -379,7 +499,7 @@ async def login(
         - 422 Unprocessable Entity: If the request body is invalid
 
     Cookies:
-        - refresh_token: HTTP-only secure cookie containing the refresh token
+        - session_token: HTTP-only secure cookie containing the session token
 
     Example Request:
         ```json
@@ -394,7 +514,7 @@ async def login(
         ```json
         {
             "message": "Login successful",
-            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+            "access_token": "Jq3dX0mS8w1v2yKQ6tV9pZr4uHc7bN5eLfA0gTiWoYs",
             "token_type": "bearer",
             "user": {
                 "id": 1,
@@ -409,22 +529,36 @@ async def login(
         - Store the access token securely (preferably in memory, not localStorage)
         - Include the access token in API requests using the Authorization header:
           "Authorization: Bearer {access_token}"
-        - The refresh token is automatically handled via cookies
-        - Implement a token refresh mechanism when access tokens expire
+        - The session cookie is sent automatically by the browser
+        - Call /auth/refresh-token to rotate the session before it expires
     """
-    # Find user by email
-    user = db.query(models.User).filter(models.User.email == login_data.email).first()
+    # Find user by email, fetching only the columns login needs as a plain row
+    user = (
+        await db.execute(
+            select(
+                models.User.id,
+                models.User.email,
+                models.User.username,
+                models.User.full_name,
+                models.User.hashed_password,
+                models.User.is_active,
+            ).where(models.User.email == login_data.email)
+        )
+    ).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
 
-    # Verify password
-    from passlib.context import CryptContext
+    # Release the pooled connection before bcrypt; the rehash UPDATE below, if any,
+    # checks out a new one
+    await db.rollback()
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    if not pwd_context.verify(login_data.password, user.hashed_password):
+    # Verify password
+    if not await auth_service.verify_password_async(
+        login_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -437,84 +571,76 @@ async def login(
             detail="Email not verified. Please verify your email before logging in.",
         )
 
-    # Determine token expiration based on remember_me flag
-    access_token_expires = (
-        auth_service.ACCESS_TOKEN_EXPIRE_MINUTES_EXTENDED
-        if login_data.remember_me
-        else auth_service.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    refresh_token_expires = (
-        auth_service.REFRESH_TOKEN_EXPIRE_DAYS_EXTENDED
-        if login_data.remember_me
-        else auth_service.REFRESH_TOKEN_EXPIRE_DAYS
-    )
-
-    # Create access token
-    access_token = auth_service.create_access_token(
-        data={"sub": user.email}, expires_minutes=access_token_expires
-    )
+    # Upgrade hashes created with an older cost factor while we have the password;
+    # the UPDATE is committed together with the new session below
+    if auth_service.password_needs_rehash(user.hashed_password):
+        await db.execute(
+            update(models.User)
+            .where(models.User.id == user.id)
+            .values(
+                hashed_password=await auth_service.hash_password_async(
+                    login_data.password
+                )
+            )
+        )
 
-    # Create refresh token
-    refresh_token = auth_service.create_refresh_token(
-        data={"sub": user.email}, expires_days=refresh_token_expires
+    # Start a server-side session; remember_me extends its lifetime
+    session_token, expires_at = await auth_service.create_user_session_async(
+        db,
+        user.id,
+        expires_days=(
+            auth_service.SESSION_EXPIRE_DAYS_EXTENDED
+            if login_data.remember_me
+            else auth_service.SESSION_EXPIRE_DAYS
+        ),
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
     )
 
-    # Set refresh token as HttpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=True,  # Set to False in development if not using HTTPS
-        samesite="lax",  # Adjust based on your security requirements
-        max_age=refresh_token_expires * 24 * 60 * 60,  # Convert days to seconds
-    )
+    _set_session_cookie(response, session_token, expires_at)
 
-    # Return response with access token and user info
+    # Return response with the session token and user info
     return {
         "message": "Login successful",
-        "access_token": access_token,
+        "access_token": session_token,
         "token_type": "bearer",
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "username": user.username,
-            "full_name": user.full_name,
-        },
+        "user": user,
     }
 
 
-@router.post("/refresh-token", response_model=Dict[str, Any])
+@router.post("/refresh-token")
 async def refresh_token(
+    request: Request,
     response: Response,
-    refresh_token: str = Cookie(None),
-    db: Session = Depends(get_db),
+    session_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
-    Refresh the access token using a refresh token.
+    Replace the current session with a new one.
 
-    This endpoint allows clients to obtain a new access token when the current one expires,
-    without requiring the user to log in again. It uses the refresh token stored in an
-    HTTP-only cookie.
+    This endpoint allows clients to obtain a fresh session token without requiring the
+    user to log in again. It uses the session token stored in an HTTP-only cookie, and
+    the old token stops working once the new one is issued.
 
     Authentication:
-        - Requires a valid refresh token in cookies
+        - Requires a valid session token in cookies
 
     Parameters:
-        - None (uses the refresh_token cookie)
+        - None (uses the session_token cookie)
 
     Returns:
         - 200 OK: Object containing:
-            - access_token: String - New JWT access token
+            - access_token: String - New session token
             - token_type: String - Token type (always "bearer")
-        - 401 Unauthorized: If the refresh token is missing, invalid, or expired
+        - 401 Unauthorized: If the session token is missing, invalid, or expired
 
     Cookies:
-        - A new refresh token is set if the current one is valid
+        - A new session token is set if the current one is valid
 
     Example Response:
         ```json
         {
-            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+            "access_token": "Jq3dX0mS8w1v2yKQ6tV9pZr4uHc7bN5eLfA0gTiWoYs",
             "token_type": "bearer"
         }
         ```
@@ -524,67 +650,45 @@ async def refresh_token(
         - The endpoint requires no body or headers as it uses HTTP cookies
         - After getting a new access token, retry the failed request
     """
-    if not refresh_token:
+    if not session_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Refresh token missing",
+            detail="Session token missing",
         )
 
-    try:
-        # Verify refresh token and get email
-        email = auth_service.verify_token(refresh_token)
-        if not email:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired refresh token",
-            )
-
-        # Verify user exists and is active
-        user = db.query(models.User).filter(models.User.email == email).first()
-        if not user or not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found or inactive",
-            )
-
-        # Create new access token
-        access_token = auth_service.create_access_token(data={"sub": email})
-
-        # Create new refresh token (rotation for security)
-        new_refresh_token = auth_service.create_refresh_token(data={"sub": email})
-
-        # Set new refresh token as HttpOnly cookie
-        response.set_cookie(
-            key="refresh_token",
-            value=new_refresh_token,
-            httponly=True,
-            secure=True,  # Set to False in development if not using HTTPS
-            samesite="lax",  # Adjust based on your security requirements
-            max_age=auth_service.REFRESH_TOKEN_EXPIRE_DAYS
-            * 24
-            * 60
-            * 60,  # Convert days to seconds
-        )
-
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-        }
-
-    except Exception as e:
+    # Rotate the session, keeping its original lifetime
+    rotated = await auth_service.rotate_session_async(
+        db,
+        session_token,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
+    if rotated is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Could not validate refresh token: {str(e)}",
+            detail="Invalid or expired session",
         )
 
+    new_session_token, expires_at = rotated
+    _set_session_cookie(response, new_session_token, expires_at)
 
-@router.post("/logout", response_model=Dict[str, str])
-async def logout(response: Response):
+    return {
+        "access_token": new_session_token,
+        "token_type": "bearer",
+    }
+
+
+@router.post("/logout")
+async def logout(
+    response: Response,
+    session_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """
-    Log out a user by clearing their refresh token cookie.
+    Log out a user by ending their session.
 
-    This endpoint invalidates the user's session by clearing the refresh token cookie.
-    The frontend should also discard the access token.
+    This endpoint terminates the session referenced by the session token cookie, if
+    any, and clears the cookie. The frontend should also discard the access token.
 
     Authentication:
         - No authentication required, but typically called with a valid session
@@ -597,7 +701,8 @@ async def logout(response: Response):
             - message: String - Confirmation of logout
 
     Cookies:
-        - Clears the refresh_token cookie
+        - Terminates the session referenced by the session_token cookie, if any
+        - Clears the session_token cookie
 
     Example Response:
         ```json
@@ -611,20 +716,21 @@ async def logout(response: Response):
         - After calling this endpoint, also clear the access token from your application state
         - Redirect the user to the login page or home page after successful logout
     """
-    # Clear refresh token cookie
-    response.delete_cookie(
-        key="refresh_token",
-        httponly=True,
-        secure=True,
-        samesite="lax",
-    )
+    # End the server-side session so it stops validating. The async session only
+    # checks out a connection when used, so cookie-less logouts never take one.
+    if session_token:
+        await auth_service.terminate_session_async(db, session_token)
+
+    # Clear session token cookie
+    response.delete_cookie(key=SESSION_COOKIE_KEY, **SESSION_COOKIE_PARAMS)
 
     return {"message": "Logged out successfully"}
 
 
-@router.post("/forgot-password", response_model=Dict[str, Any])
+@router.post("/forgot-password")
 async def forgot_password(
-    email_data: EmailVerificationRequest, db: Session = Depends(get_db)
+    email_data: EmailVerificationRequest,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Request a password reset email.
@@ -641,7 +747,7 @@ async def forgot_password(
     Returns:
         - 200 OK: Object containing:
             - message: String - Status message
-            - email_sent: Boolean - Whether the email was sent successfully
+            - email_sent: Boolean - Whether the email was queued for sending
         - 404 Not Found: If no user with the provided email exists
         - 422 Unprocessable Entity: If the request body is invalid
 
@@ -664,9 +770,20 @@ async def forgot_password(
         - Display a message to the user to check their email
         - Do not reveal whether the email exists in the system for security reasons
           (the API will still return 200 even if the email doesn't exist)
+        - Repeated requests for the same address within a minute return the same
+          generic message with email_sent false and no email is sent
     """
+    # Past the per-minute limit, answer without touching the database or SMTP
+    if _email_send_limited("reset", email_data.email):
+        return {
+            "message": "If a user with this email exists, a password reset email has been sent",
+            "email_sent": False,
+        }
+
     # Check if user exists (but don't reveal this information in the response)
-    user = db.query(models.User).filter(models.User.email == email_data.email).first()
+    user = await db.scalar(
+        select(models.User.id).where(models.User.email == email_data.email)
+    )
 
     # If user doesn't exist, still return success but don't send email
     # This prevents email enumeration attacks
@@ -679,12 +796,14 @@ async def forgot_password(
     # Generate password reset token
     reset_token = auth_service.create_password_reset_token(email_data.email)
 
-    # Send password reset email
-    email_sent = email_service.send_password_reset_email(email_data.email, reset_token)
+    # Send password reset email on the email worker threads; failures are logged
+    email_service.send_in_background(
+        email_service.send_password_reset_email, email_data.email, reset_token
+    )
 
     return {
         "message": "Password reset email sent",
-        "email_sent": email_sent,
+        "email_sent": True,
     }
 
 
@@ -694,18 +813,21 @@ class ResetPasswordRequest(BaseModel):
     token: str
     new_password: str = Field(..., min_length=4)
 
-    class Config:
-        json_schema_extra = {
+    _check_password = field_validator("new_password")(_check_password_bytes)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "new_password": "newSecurePassword123",
             }
         }
+    )
 
 
-@router.post("/reset-password", response_model=Dict[str, Any])
+@router.post("/reset-password")
 async def reset_password(
-    reset_data: ResetPasswordRequest, db: Session = Depends(get_db)
+    reset_data: ResetPasswordRequest, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Reset a user's password using a reset token.
@@ -747,43 +869,35 @@ async def reset_password(
         - After a successful password reset, redirect the user to the login page
         - Provide clear feedback about password requirements
     """
-    try:
-        # Verify token and get email
-        email = auth_service.verify_token(reset_data.token)
-        if not email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid or expired token",
-            )
-
-        # Find user by email
-        user = db.query(models.User).filter(models.User.email == email).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
-        # Hash new password
-        from passlib.context import CryptContext
-
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        hashed_password = pwd_context.hash(reset_data.new_password)
+    # Verify token and get email
+    email = auth_service.verify_token(reset_data.token, token_type="password_reset")
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired token",
+        )
 
-        # Update user's password
-        user.hashed_password = hashed_password
-        db.commit()
+    # Hash new password
+    hashed_password = await auth_service.hash_password_async(reset_data.new_password)
 
-        return {"message": "Password reset successful", "password_reset": True}
-    except Exception as e:
+    # Update user's password in a single UPDATE keyed on the email
+    result = await db.execute(
+        update(models.User)
+        .where(models.User.email == email)
+        .values(hashed_password=hashed_password)
+    )
+    await db.commit()
+    if result.rowcount == 0:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Password reset failed: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    return {"message": "Password reset successful", "password_reset": True}
+
 
 # Dependency to get the current user from the session
 async def get_current_user(
-    session_token: str = Cookie(None), db: Session = Depends(get_db)
+    session_token: str = Cookie(None), db: AsyncSession = Depends(get_async_db)
 ) -> Optional[models.User]:
     """
     Get the current authenticated user from the session token.
@@ -798,10 +912,10 @@ async def get_current_user(
     if not session_token:
         return None
 
-    return auth_service.validate_session(db=db, token=session_token)
+    return await auth_service.validate_session_async(db=db, token=session_token)
 
 
-@router.get("/me", status_code=status.HTTP_200_OK)
+@router.get("/me", status_code=status.HTTP_200_OK, response_model=CurrentUserOut)
 async def get_current_user_info(current_user: models.User = Depends(get_current_user)):
     """
     Get information about the currently authenticated user.
@@ -850,11 +964,4 @@ async def get_current_user_info(current_user: models.User = Depends(get_current_
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return {
-        "id": current_user.id,
-        "email": current_user.email,
-        "username": current_user.username,
-        "full_name": current_user.full_name,
-        "is_active": current_user.is_active,
-        "created_at": current_user.created_at.isoformat(),
-    }
+    return current_user
@@ -6,9 +6,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
-from ..db.database import get_db
+from ..db.database import get_async_db
 from ..db.models import Team, TeamInvitation, User
 from ..services import team_service
 from ..services.auth_service import get_current_user
@@ -35,8 +35,7 @@ class TeamResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TeamMemberResponse(BaseModel):
@@ -69,8 +68,7 @@ class TeamInvitationResponse(BaseModel):
     expires_at: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TeamUpdateRequest(BaseModel):
@@ -96,7 +94,9 @@ class UserTeamResponse(BaseModel):
 
 @router.post("/teams", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
 async def create_team(
-    team_data: TeamCreate, db=Depends(get_db), current_user=Depends(get_current_user)
+    team_data: TeamCreate,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
 ) -> Team:
     """
     Create a new team.
@@ -116,7 +116,7 @@ async def create_team(
         - 401 Unauthorized: If the token is missing or invalid
         - 422 Unprocessable Entity: If the request body is invalid
     """
-    team = team_service.create_team(
+    team = await team_service.create_team(
         db=db,
         creator_id=current_user.id,
         name=team_data.name,
@@ -128,7 +128,7 @@ async def create_team(
 @router.post("/teams/join", response_model=TeamResponse)
 async def join_team(
     join_data: JoinTeamRequest,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ) -> Team:
     """
@@ -147,7 +147,7 @@ async def join_team(
         - 401 Unauthorized: If the token is missing or invalid
         - 404 Not Found: If the invite code is invalid
     """
-    team, _ = team_service.join_team_by_invite_code(
+    team, _ = await team_service.join_team_by_invite_code(
         db=db, user_id=current_user.id, invite_code=join_data.invite_code
     )
     return team
@@ -155,7 +155,7 @@ async def join_team(
 
 @router.get("/teams/my", response_model=List[UserTeamResponse])
 async def get_my_teams(
-    db=Depends(get_db), current_user=Depends(get_current_user)
+    db=Depends(get_async_db), current_user=Depends(get_current_user)
 ) -> List[Dict]:
     """
     Get all teams that the current user is a member of.
@@ -171,13 +171,13 @@ async def get_my_teams(
             - joined_at: When the user joined the team
         - 401 Unauthorized: If the token is missing or invalid
     """
-    teams = team_service.get_user_teams(db=db, user_id=current_user.id)
+    teams = await team_service.get_user_teams(db=db, user_id=current_user.id)
     return teams
 
 
 @router.get("/teams/{team_id}", response_model=TeamResponse)
 async def get_team(
-    team_id: int, db=Depends(get_db), current_user=Depends(get_current_user)
+    team_id: int, db=Depends(get_async_db), current_user=Depends(get_current_user)
 ) -> Team:
     """
     Get information about a specific team.
@@ -198,16 +198,15 @@ async def get_team(
         - 404 Not Found: If the team doesn't exist
     """
     # First check if user is a member of this team
-    teams = team_service.get_user_teams(db=db, user_id=current_user.id)
-    is_member = any(team_info["team"].id == team_id for team_info in teams)
-
-    if not is_member:
+    if not await team_service.is_team_member(
+        db=db, user_id=current_user.id, team_id=team_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this team",
         )
 
-    team = team_service.get_team_by_id(db=db, team_id=team_id)
+    team = await team_service.get_team_by_id(db=db, team_id=team_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
@@ -220,7 +219,7 @@ async def get_team(
 async def get_team_members(
     team_id: int,
     include_inactive: bool = Query(False, description="Include inactive members"),
-    db=Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ) -> List[TeamMemberResponse]:
     """
@@ -244,20 +243,17 @@ async def get_team_members(
         - 403 Forbidden: If the user is not a member of the team
     """
     # First check if user is a member of this team
-    teams = team_service.get_user_teams(db=db, user_id=current_user.id)
-    is_member = any(team_info["team"].id == team_id for team_info in teams)
-
-    if not is_member:
+    if not await team_service.is_team_member(
+        db=db, user_id=current_user.id, team_id=team_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this team",
         )
 
-    members = team_service.get_team_members(db=db, team_id=team_id)
-
-    # Filter out inactive members if requested
-    if not include_inactive:
-        members = [m for m in members if m["is_active"]]
+    members = await team_service.get_team_members(
+        db=db, team_id=team_id, active_only=not include_inactive
+    )
 
     # Transform to response model
     result: List[TeamMemberResponse] = []
@@ -282,7 +278,7 @@ async def get_team_members(
 async def update_team(
     team_id: int,
     team_data: TeamUpdateRequest,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ) -> Team:
     """
@@ -308,7 +304,7 @@ async def update_team(
         - 404 Not Found: If the team doesn't exist
         - 422 Unprocessable Entity: If the request body is invalid
     """
-    team = team_service.update_team(
+    team = await team_service.update_team(
         db=db,
         team_id=team_id,
         user_id=current_user.id,
@@ -320,7 +316,7 @@ async def update_team(
 
 @router.post("/teams/{team_id}/regenerate-invite", response_model=Dict[str, str])
 async def regenerate_invite_code(
-    team_id: int, db=Depends(get_db), current_user=Depends(get_current_user)
+    team_id: int, db=Depends(get_async_db), current_user=Depends(get_current_user)
 ) -> Dict[str, str]:
     """
     Regenerate the invite code for a team.
@@ -340,7 +336,7 @@ async def regenerate_invite_code(
         - 403 Forbidden: If the user doesn't have permission to regenerate the invite code
         - 404 Not Found: If the team doesn't exist
     """
-    new_code = team_service.regenerate_invite_code(
+    new_code = await team_service.regenerate_invite_code(
         db=db, team_id=team_id, user_id=current_user.id
     )
     return {"invite_code": new_code}
@@ -350,7 +346,7 @@ async def regenerate_invite_code(
 async def remove_member(
     team_id: int,
     member_id: int,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ) -> Dict[str, bool]:
     """
@@ -373,7 +369,7 @@ async def remove_member(
         - 403 Forbidden: If the user doesn't have permission to remove members
         - 404 Not Found: If the team or member doesn't exist
     """
-    success = team_service.remove_team_member(
+    success = await team_service.remove_team_member(
         db=db, team_id=team_id, admin_id=current_user.id, member_id=member_id
     )
     return {"success": success}
@@ -387,7 +383,7 @@ async def remove_member(
 async def invite_to_team(
     team_id: int,
     invitation_data: TeamInvitationCreate,
-    db=Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ) -> Dict:
     """
@@ -413,7 +409,7 @@ async def invite_to_team(
         - 404 Not Found: If the team doesn't exist
         - 422 Unprocessable Entity: If the request body is invalid
     """
-    invitation = team_service.create_team_invitation(
+    invitation = await team_service.create_team_invitation(
         db=db,
         team_id=team_id,
         inviter_id=current_user.id,
@@ -421,7 +417,7 @@ async def invite_to_team(
     )
 
     # Get the team name for the response
-    team = team_service.get_team_by_id(db=db, team_id=team_id)
+    team = await team_service.get_team_by_id(db=db, team_id=team_id)
 
     if not team:
         raise HTTPException(
@@ -434,7 +430,7 @@ async def invite_to_team(
         "team_name": team.name,
         "inviter_email": current_user.email,
         "invitee_email": invitation.invitee_email,
-        "status": invitation.status,
+        "status": invitation.status.name.lower(),
         "expires_at": invitation.expires_at,
         "created_at": invitation.created_at,
     }
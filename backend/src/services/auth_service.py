@@ -2,51 +2,195 @@
 Authentication service for managing user authentication and verification.
 """
 
+import hashlib
 import os
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Set, Tuple
 
+import anyio
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from sqlalchemy.orm import joinedload, load_only, raiseload
 
 from ..db import models
-from ..db.database import get_db
+from ..db.database import get_async_db, get_async_engine
+from ..utils.cache import TTLCache
 from ..utils.logger import app_logger
 from ..utils.config import app_settings
 
 # Security scheme for token authentication
 security = HTTPBearer()
 
+# bcrypt only reads the first 72 bytes of a password
+BCRYPT_MAX_BYTES = 72
+
+# Upper bound for auto-tuned bcrypt cost; each step doubles the work
+BCRYPT_MAX_AUTO_ROUNDS = 16
+
+# JWTs are signed and verified here with the shared SECRET_KEY, so only the HMAC
+# algorithms apply. Anything that verifies tokens outside this service should move
+# to an asymmetric algorithm such as EdDSA instead of sharing the secret.
+JWT_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+# Shortest SECRET_KEY that gives HS256 its full strength
+JWT_MIN_SECRET_BYTES = 32
+
+
+def _calibrate_bcrypt_rounds(min_rounds: int, target_ms: int) -> int:
+    """
+    Find the smallest bcrypt cost that takes at least target_ms on this host.
+
+    Args:
+        min_rounds: Lowest cost to consider
+        target_ms: Desired time per hash in milliseconds
+
+    Returns:
+        int: The chosen cost factor, between min_rounds and BCRYPT_MAX_AUTO_ROUNDS
+    """
+    rounds = min_rounds
+    while rounds < BCRYPT_MAX_AUTO_ROUNDS:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            bcrypt.hashpw(b"x" * 16, bcrypt.gensalt(rounds=rounds))
+            timings.append(time.perf_counter() - start)
+        if sorted(timings)[1] * 1000 >= target_ms:
+            break
+        rounds += 1
+    return rounds
+
+
+# Recently verified JWTs, keyed on (token digest, token_type) and storing (email, exp).
+# Entries live long enough to cover a verification link being opened more than once.
+_verified_tokens: TTLCache[Tuple[str, int]] = TTLCache(maxsize=10_000, ttl=900)
+
+
+# Per-process key for token cache digests. Cache lookups compare digests with ==,
+# so keying them keeps those comparisons from revealing anything an attacker can
+# relate back to a real token.
+_TOKEN_DIGEST_KEY = secrets.token_bytes(32)
+
+
+def _token_key(token: str, token_type: str) -> Tuple[bytes, str]:
+    """
+    Build a compact cache key for a token without keeping the token itself.
+
+    Args:
+        token: Raw token
+        token_type: Expected token type
+
+    Returns:
+        Tuple[bytes, str]: 16-byte keyed BLAKE2b digest of the token and its type
+    """
+    digest = hashlib.blake2b(
+        token.encode(), digest_size=16, key=_TOKEN_DIGEST_KEY
+    ).digest()
+    return digest, token_type
+
+
+# Validated sessions are recorded as active; the ids are written back in one UPDATE
+# at most this often
+SESSION_TOUCH_FLUSH_SECONDS = 15
+
+# User columns loaded for an authenticated request; everything else, including the
+# password hash, is deferred until something actually reads it
+_SESSION_USER_COLUMNS = (
+    models.User.id,
+    models.User.email,
+    models.User.username,
+    models.User.full_name,
+    models.User.is_active,
+    models.User.is_superuser,
+    models.User.created_at,
+)
+
+# bcrypt is CPU-bound, so async callers hash in worker threads, one per core
+_hash_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_hash_limiter() -> anyio.CapacityLimiter:
+    """
+    Get the capacity limiter bounding concurrent password hashing threads.
+
+    Created on first use so it binds to the running event loop.
+
+    Returns:
+        anyio.CapacityLimiter: Limiter sized to the number of CPU cores
+    """
+    global _hash_limiter
+    if _hash_limiter is None:
+        _hash_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+    return _hash_limiter
+
 
 class AuthService:
     """
     Service for handling authentication-related functionality.
     """
 
+    # Fixed attribute layout: no per-instance __dict__ and no accidental new fields
+    __slots__ = (
+        "secret_key",
+        "algorithm",
+        "verification_token_expire_minutes",
+        "bcrypt_rounds",
+        "_bcrypt_prefix",
+        "_touched_sessions",
+        "_touched_flushed_at",
+        "_touch_lock",
+        "SESSION_EXPIRE_DAYS",
+        "SESSION_EXPIRE_DAYS_EXTENDED",
+        "PASSWORD_RESET_TOKEN_EXPIRE_MINUTES",
+        "session_expire_days",
+    )
+
     def __init__(self):
         """Initialize the authentication service."""
         self.secret_key = app_settings.SECRET_KEY_VALUE
         self.algorithm = app_settings.ALGORITHM
+        if self.algorithm not in JWT_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported ALGORITHM {self.algorithm!r}, "
+                f"expected one of {', '.join(JWT_ALGORITHMS)}"
+            )
+        if len(self.secret_key.encode()) < JWT_MIN_SECRET_BYTES:
+            app_logger.warning(
+                "SECRET_KEY is shorter than %s bytes; use a longer random key",
+                JWT_MIN_SECRET_BYTES,
+            )
         self.verification_token_expire_minutes = (
             app_settings.EMAIL_VERIFICATION_TOKEN_EXPIRE_MINUTES
         )
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-        # Token expiration settings
-        self.ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour
-        self.ACCESS_TOKEN_EXPIRE_MINUTES_EXTENDED = 24 * 7 * 60  # 1 week
-        self.REFRESH_TOKEN_EXPIRE_DAYS = 7  # 1 week
-        self.REFRESH_TOKEN_EXPIRE_DAYS_EXTENDED = 30  # 1 month
+        # bcrypt cost for new hashes, optionally calibrated to this host
+        self.bcrypt_rounds = app_settings.BCRYPT_ROUNDS
+        if app_settings.BCRYPT_AUTO_TUNE:
+            self.bcrypt_rounds = _calibrate_bcrypt_rounds(
+                app_settings.BCRYPT_ROUNDS, app_settings.BCRYPT_TARGET_MS
+            )
+            app_logger.info("Auto-tuned bcrypt cost to %s", self.bcrypt_rounds)
+        # Hashes with any other ident or cost are re-hashed on the next login
+        self._bcrypt_prefix = f"$2b${self.bcrypt_rounds:02d}$"
+
+        # Sessions used since last_active_at was last written, see _touch_session_async
+        self._touched_sessions: Set[int] = set()
+        self._touched_flushed_at = time.monotonic()
+        self._touch_lock = threading.Lock()
+
+        # Token and session expiration settings
+        self.SESSION_EXPIRE_DAYS = 7  # 1 week
+        self.SESSION_EXPIRE_DAYS_EXTENDED = 30  # 1 month
         self.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES = 30  # 30 minutes
 
         # Legacy attribute for backward compatibility
-        self.access_token_expire_minutes = self.ACCESS_TOKEN_EXPIRE_MINUTES
-        self.session_expire_days = self.REFRESH_TOKEN_EXPIRE_DAYS
+        self.session_expire_days = self.SESSION_EXPIRE_DAYS
 
     def create_verification_token(self, email: str) -> str:
         """
@@ -66,50 +210,6 @@ class AuthService:
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
 
-    def create_access_token(
-        self, data: Dict[str, Any], expires_minutes: Optional[int] = None
-    ) -> str:
-        """
-        Create an access token for API authentication.
-
-        Args:
-            data: Data to encode in the token (should include 'sub' key with user identifier)
-            expires_minutes: Token expiration time in minutes (defaults to ACCESS_TOKEN_EXPIRE_MINUTES)
-
-        Returns:
-            str: JWT access token
-        """
-        to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=expires_minutes or self.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-        to_encode.update({"exp": expire, "type": "access_token"})
-
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
-
-    def create_refresh_token(
-        self, data: Dict[str, Any], expires_days: Optional[int] = None
-    ) -> str:
-        """
-        Create a refresh token for obtaining new access tokens.
-
-        Args:
-            data: Data to encode in the token (should include 'sub' key with user identifier)
-            expires_days: Token expiration time in days (defaults to REFRESH_TOKEN_EXPIRE_DAYS)
-
-        Returns:
-            str: JWT refresh token
-        """
-        to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=expires_days or self.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-        to_encode.update({"exp": expire, "type": "refresh_token"})
-
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
-
     def create_password_reset_token(self, email: str) -> str:
         """
         Create a password reset token.
@@ -130,7 +230,7 @@ class AuthService:
 
     def verify_token(
         self, token: str, token_type: str = "email_verification"
-    ) -> Tuple[bool, Optional[str]]:
+    ) -> Optional[str]:
         """
         Verify a token and return the email if valid.
 
@@ -139,8 +239,17 @@ class AuthService:
             token_type: Type of token to verify (default: "email_verification")
 
         Returns:
-            Tuple[bool, Optional[str]]: (is_valid, email if valid or None)
+            Optional[str]: The email the token was issued for, or None if invalid
         """
+        # Skip signature checking and JSON parsing for tokens seen recently
+        now = time.time()
+        key = _token_key(token, token_type)
+        cached = _verified_tokens.get(key)
+        if cached is not None:
+            email, exp = cached
+            if exp > now:
+                return email
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             email: str = payload.get("sub")
@@ -148,55 +257,76 @@ class AuthService:
             token_type_from_payload = payload.get("type")
 
             if not email or not exp:
-                return False, None
+                return None
 
             # Check if token is of correct type
             if token_type_from_payload != token_type:
-                return False, None
+                return None
 
-            # Token is valid, return the email
-            return True, email
+            # Token is valid, cache it no longer than its own expiry
+            _verified_tokens.set(
+                key,
+                (email, exp),
+                ttl=min(_verified_tokens.ttl, exp - now),
+            )
+            return email
 
-        except JWTError as e:
-            app_logger.error(f"JWT verification error: {str(e)}")
-            return False, None
+        except jwt.PyJWTError as e:
+            app_logger.error("JWT verification error: %s", e)
+            return None
 
-    def process_email_verification(self, db: Session, token: str) -> Tuple[bool, str]:
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
-        Process email verification by validating the token and updating the user's status.
+        Verify a password against its hash.
 
         Args:
-            db: Database session
-            token: Verification token
+            plain_password: The plaintext password to verify
+            hashed_password: The hashed password to check against
 
         Returns:
-            Tuple[bool, str]: (success, message)
+            bool: True if the password matches, False otherwise
         """
-        # Verify the token
-        is_valid, email = self.verify_token(token)
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8")[:BCRYPT_MAX_BYTES],
+                hashed_password.encode("utf-8"),
+            )
+        except ValueError:
+            # Malformed or non-bcrypt hash
+            return False
 
-        if not is_valid or not email:
-            return False, "Invalid or expired verification token"
+    def hash_password(self, password: str) -> str:
+        """
+        Hash a password using bcrypt.
 
-        # Find the user by email
-        user = db.query(models.User).filter(models.User.email == email).first()
+        Args:
+            password: The plaintext password to hash
 
-        if not user:
-            return False, "User not found"
+        Returns:
+            str: The hashed password
+        """
+        return bcrypt.hashpw(
+            password.encode("utf-8")[:BCRYPT_MAX_BYTES],
+            bcrypt.gensalt(rounds=self.bcrypt_rounds),
+        ).decode("utf-8")
 
-        # Check if already verified
-        if user.is_active:
-            return True, "Email already verified"
+    def password_needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check whether a stored hash uses outdated settings and should be replaced.
 
-        # Update user status
-        user.is_active = True
-        db.commit()
+        Args:
+            hashed_password: The stored password hash
 
-        return True, "Email verification successful"
+        Returns:
+            bool: True if the hash should be regenerated on next successful login
+        """
+        return not hashed_password.startswith(self._bcrypt_prefix)
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
         """
-        Verify a password against its hash.
+        Verify a password in a worker thread so the event loop is not blocked.
 
         Args:
             plain_password: The plaintext password to verify
@@ -205,11 +335,16 @@ class AuthService:
         Returns:
             bool: True if the password matches, False otherwise
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await anyio.to_thread.run_sync(
+            self.verify_password,
+            plain_password,
+            hashed_password,
+            limiter=_get_hash_limiter(),
+        )
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password_async(self, password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password in a worker thread so the event loop is not blocked.
 
         Args:
             password: The plaintext password to hash
@@ -217,136 +352,240 @@ class AuthService:
         Returns:
             str: The hashed password
         """
-        return self.pwd_context.hash(password)
+        return await anyio.to_thread.run_sync(
+            self.hash_password, password, limiter=_get_hash_limiter()
+        )
 
-    def authenticate_user(
-        self, db: Session, email: str, password: str
-    ) -> Optional[models.User]:
+    async def create_user_session_async(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        expires_days: Optional[int] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> Tuple[str, datetime]:
         """
-        Authenticate a user by verifying their email and password.
+        Create a new session for a user and record the login.
+
+        Commits the session, so any pending changes on db are committed with it.
 
         Args:
-            db: Database session
-            email: User's email
-            password: User's password
+            db: Async database session
+            user_id: ID of the user to create a session for
+            expires_days: Session lifetime in days (defaults to session_expire_days)
+            ip_address: IP address of the client
+            user_agent: User agent of the client
 
         Returns:
-            Optional[models.User]: The user if authentication is successful, None otherwise
+            Tuple[str, datetime]: (session token, expiry time)
         """
-        user = db.query(models.User).filter(models.User.email == email).first()
-
-        if not user or not self.verify_password(password, user.hashed_password):
-            return None
-
-        # Check if user is active (email verified)
-        if not user.is_active:
-            return None
+        now = datetime.now(timezone.utc)
+        token = secrets.token_urlsafe(32)
+        expires_at = now + timedelta(days=expires_days or self.session_expire_days)
+
+        db.add(
+            models.UserSession(
+                user_id=user_id,
+                token=token,
+                expires_at=expires_at,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                is_active=True,
+            )
+        )
+        await db.execute(
+            update(models.User).where(models.User.id == user_id).values(last_login=now)
+        )
+        await db.commit()
 
-        return user
+        return token, expires_at
 
-    def create_user_session(
+    async def rotate_session_async(
         self,
-        db: Session,
-        user: models.User,
+        db: AsyncSession,
+        token: str,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-    ) -> models.UserSession:
+    ) -> Optional[Tuple[str, datetime]]:
         """
-        Create a new session for a user.
+        Replace a valid session with a new one of the same kind.
+
+        A remember-me session is renewed for SESSION_EXPIRE_DAYS_EXTENDED days and
+        any other session for session_expire_days.
 
         Args:
-            db: Database session
-            user: The user to create a session for
+            db: Async database session
+            token: Current session token
             ip_address: IP address of the client
             user_agent: User agent of the client
 
         Returns:
-            models.UserSession: The created session
+            Optional[Tuple[str, datetime]]: (new session token, expiry time), or None
+            if the session is invalid, expired or belongs to an inactive user
         """
-        # Generate a random token for the session
-        token = secrets.token_urlsafe(32)
-
-        # Set expiration time
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=self.session_expire_days
-        )
-
-        # Create a new session
-        session = models.UserSession(
-            user_id=user.id,
-            token=token,
-            expires_at=expires_at,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            is_active=True,
+        now = datetime.now(timezone.utc)
+        session = await db.scalar(
+            select(models.UserSession)
+            .join(models.UserSession.user)
+            .where(
+                models.UserSession.token == token,
+                models.UserSession.is_active == True,
+                models.UserSession.expires_at > now,
+                models.User.is_active == True,
+            )
         )
+        if session is None:
+            return None
 
-        # Update last login time for the user
-        user.last_login = datetime.now(timezone.utc)
+        session.is_active = False
 
-        db.add(session)
-        db.commit()
-        db.refresh(session)
+        # Only expires_at is compared with now: both come from this process's UTC
+        # clock, whereas created_at is set by MySQL in the server's time zone.
+        # Session expiry is stored as naive UTC by MySQL.
+        old_expires_at = session.expires_at
+        if old_expires_at.tzinfo is None:
+            old_expires_at = old_expires_at.replace(tzinfo=timezone.utc)
+        # Only a remember-me session can have more than the standard lifetime left
+        if old_expires_at - now > timedelta(days=self.session_expire_days):
+            expires_days = self.SESSION_EXPIRE_DAYS_EXTENDED
+        else:
+            expires_days = self.session_expire_days
+
+        new_token = secrets.token_urlsafe(32)
+        expires_at = now + timedelta(days=expires_days)
+        db.add(
+            models.UserSession(
+                user_id=session.user_id,
+                token=new_token,
+                expires_at=expires_at,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                is_active=True,
+            )
+        )
+        await db.commit()
 
-        return session
+        return new_token, expires_at
 
-    def validate_session(self, db: Session, token: str) -> Optional[models.User]:
+    async def validate_session_async(
+        self, db: AsyncSession, token: str
+    ) -> Optional[models.User]:
         """
         Validate a session token and return the associated user.
 
         Args:
-            db: Database session
+            db: Async database session
             token: Session token to validate
 
         Returns:
             Optional[models.User]: The user if the session is valid, None otherwise
         """
-        session = (
-            db.query(models.UserSession)
-            .filter(
+        # Sessions are checked against the database on every request, so a logout
+        # or rotation handled by one worker takes effect in all of them at once.
+        # Load the user's profile columns in the same SELECT; its relationships
+        # raise instead of lazy loading so per-request N+1 queries can't creep in
+        session = await db.scalar(
+            select(models.UserSession)
+            .options(
+                joinedload(models.UserSession.user).options(
+                    load_only(*_SESSION_USER_COLUMNS), raiseload("*")
+                )
+            )
+            .where(
                 models.UserSession.token == token,
                 models.UserSession.is_active == True,
                 models.UserSession.expires_at > datetime.now(timezone.utc),
             )
-            .first()
         )
 
         if not session:
             return None
 
-        # Update last active time
-        session.last_active_at = datetime.now(timezone.utc)
-        db.commit()
+        # last_active_at is written back in batches
+        await self._touch_session_async(session.id)
 
-        # Return the user associated with this session
         return session.user
 
-    def terminate_session(self, db: Session, token: str) -> bool:
+    def _queue_touch(self, session_id: int) -> Optional[Set[int]]:
+        """
+        Record that a session was used.
+
+        Touched sessions are collected in memory and their last_active_at is set in
+        a single UPDATE once SESSION_TOUCH_FLUSH_SECONDS have passed since the
+        previous write, by whichever request comes next.
+
+        Args:
+            session_id: ID of the session that was used
+
+        Returns:
+            Optional[Set[int]]: IDs the caller should write back now, or None
+        """
+        now = time.monotonic()
+        with self._touch_lock:
+            self._touched_sessions.add(session_id)
+            if now - self._touched_flushed_at < SESSION_TOUCH_FLUSH_SECONDS:
+                return None
+            session_ids = self._touched_sessions
+            self._touched_sessions = set()
+            self._touched_flushed_at = now
+        return session_ids
+
+    def _requeue_touches(self, session_ids: Set[int]) -> None:
+        """
+        Put back touched sessions whose write failed, so the next flush retries them.
+
+        Args:
+            session_ids: IDs of the sessions that were not written
+        """
+        with self._touch_lock:
+            self._touched_sessions |= session_ids
+
+    async def _touch_session_async(self, session_id: int) -> None:
+        """
+        Record that a session was used and periodically persist it.
+
+        The write runs in its own transaction, so it never commits the caller's
+        session, and a failure is logged rather than failing authentication.
+
+        Args:
+            session_id: ID of the session that was used
+        """
+        session_ids = self._queue_touch(session_id)
+        if not session_ids:
+            return
+
+        try:
+            async with get_async_engine().begin() as conn:
+                await conn.execute(
+                    update(models.UserSession)
+                    .where(models.UserSession.id.in_(session_ids))
+                    .values(last_active_at=datetime.now(timezone.utc))
+                )
+        except Exception as e:
+            self._requeue_touches(session_ids)
+            app_logger.error("Failed to update session activity: %s", e)
+
+    async def terminate_session_async(self, db: AsyncSession, token: str) -> bool:
         """
         Terminate a user session (logout).
 
         Args:
-            db: Database session
+            db: Async database session
             token: Session token to terminate
 
         Returns:
             bool: True if the session was terminated, False otherwise
         """
-        session = (
-            db.query(models.UserSession)
-            .filter(
+        result = await db.execute(
+            update(models.UserSession)
+            .where(
                 models.UserSession.token == token, models.UserSession.is_active == True
             )
-            .first()
+            .values(is_active=False)
         )
+        await db.commit()
 
-        if not session:
-            return False
-
-        session.is_active = False
-        db.commit()
-
-        return True
+        return result.rowcount > 0
 
 
 # Create a singleton instance
@@ -355,7 +594,7 @@ auth_service = AuthService()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> models.User:
     """
     Get the current authenticated user from the session token.
@@ -381,9 +620,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Use the synchronous validate_session method but with async session
-    # This is temporary and should be updated to fully async implementation
-    user = auth_service.validate_session(db, token)
+    user = await auth_service.validate_session_async(db, token)
 
     if not user:
         raise HTTPException(
@@ -3,8 +3,14 @@ Email service for sending verification emails and other email notifications.
 """
 
 import os
+import queue
 import smtplib
-from typing import Dict, Optional, Any
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional, Any, Tuple
 
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -12,6 +18,33 @@ from email.mime.multipart import MIMEMultipart
 from ..utils.config import app_settings
 from ..utils.logger import app_logger
 
+# Pooled connections idle longer than this are checked with NOOP before reuse
+SMTP_NOOP_INTERVAL_SECONDS = 30
+
+# Email bodies live in email_templates/ and are fixed apart from the link, so each
+# file is read and parsed once at import
+_TEMPLATE_DIR = Path(__file__).parent / "email_templates"
+
+
+def _load_template(name: str) -> string.Template:
+    """
+    Load an email body template from the email_templates directory.
+
+    Templates use string.Template syntax: $url for the link, $$ for a literal "$".
+
+    Args:
+        name: File name of the template
+
+    Returns:
+        string.Template: The parsed template, with $url as its placeholder
+    """
+    return string.Template((_TEMPLATE_DIR / name).read_text(encoding="utf-8"))
+
+
+_VERIFY_TEXT = _load_template("verify_email.txt")
+_VERIFY_HTML = _load_template("verify_email.html")
+_RESET_HTML = _load_template("reset_password.html")
+
 
 class EmailService:
     """
@@ -29,6 +62,24 @@ class EmailService:
         self.sender = app_settings.AUTH_EMAIL_HOST_USER
         self.frontend_url = app_settings.FRONTEND_URL
 
+        # Logged-in SMTP connections with the time each was last used. The semaphore
+        # caps how many connections exist at once, idle or in use.
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(app_settings.SMTP_POOL_SIZE)
+
+        # Worker threads for send_in_background, one per pooled connection, so
+        # queued emails wait here instead of holding the server's shared threadpool
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # The templated emails only vary by recipient and link, so their MIME text
+        # is generated once and those two values are filled in per send
+        self._verify_message = self._prebuild(
+            "Verify your email address", _VERIFY_TEXT, _VERIFY_HTML
+        )
+        self._reset_message = self._prebuild(
+            "Reset Your Password - Team Pulse Check", _RESET_HTML
+        )
+
         if not self.email_user or not self.email_password:
             app_logger.warning(
                 "Email credentials not properly configured. " "Emails will not be sent."
@@ -65,6 +116,112 @@ class EmailService:
 
         return message
 
+    def _prebuild(
+        self,
+        subject: str,
+        body: string.Template,
+        html_body: Optional[string.Template] = None,
+    ) -> string.Template:
+        """
+        Render a templated email to MIME text once, keeping its placeholders.
+
+        Args:
+            subject: Email subject
+            body: Plain text body template
+            html_body: HTML body template (optional)
+
+        Returns:
+            string.Template: Full message text with $to and the body placeholders
+        """
+        message = self._create_message(
+            "$to", subject, body.template, html_body.template if html_body else None
+        )
+        return string.Template(message.as_string())
+
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open and authenticate a new SMTP connection.
+
+        Returns:
+            smtplib.SMTP: A connection ready to send mail
+        """
+        server = smtplib.SMTP(self.email_host, self.email_port)
+        try:
+            if self.use_tls:
+                server.starttls()
+            server.login(self.email_user, self.email_password)
+        except Exception:
+            self._close(server)
+            raise
+        return server
+
+    def _close(self, server: smtplib.SMTP) -> None:
+        """
+        Close an SMTP connection, ignoring errors from one that is already dead.
+
+        Args:
+            server: Connection to close
+        """
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        """
+        Take an idle connection from the pool, or open a new one.
+
+        Connections that have been idle for more than SMTP_NOOP_INTERVAL_SECONDS are
+        checked with NOOP first and replaced if the server has dropped them.
+
+        Returns:
+            smtplib.SMTP: A connection ready to send mail
+        """
+        try:
+            server, last_used = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+        if time.monotonic() - last_used > SMTP_NOOP_INTERVAL_SECONDS:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(server)
+            return self._connect()
+
+        return server
+
+    def send_in_background(self, send: Callable[..., bool], *args: Any) -> None:
+        """
+        Queue an email to be sent on the service's worker threads.
+
+        Returns immediately; the send method logs its own failures.
+
+        Args:
+            send: One of the send_* methods
+            *args: Arguments for the send method
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=app_settings.SMTP_POOL_SIZE, thread_name_prefix="email"
+            )
+        self._executor.submit(send, *args)
+
+    def close(self) -> None:
+        """Wait for queued emails to be sent, then close all idle pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
     def send_email(
         self, recipient: str, subject: str, body: str, html_body: Optional[str] = None
     ) -> bool:
@@ -77,6 +234,20 @@ class EmailService:
             body: Plain text email body
             html_body: HTML version of the email body (optional)
 
+        Returns:
+            bool: True if email was sent successfully, False otherwise
+        """
+        message = self._create_message(recipient, subject, body, html_body)
+        return self._deliver(recipient, message.as_string())
+
+    def _deliver(self, recipient: str, message: str) -> bool:
+        """
+        Send a rendered message over a pooled connection.
+
+        Args:
+            recipient: Email address of the recipient
+            message: Full message text, headers included
+
         Returns:
             bool: True if email was sent successfully, False otherwise
         """
@@ -84,20 +255,32 @@ class EmailService:
             app_logger.error("Email service not properly configured")
             return False
 
-        message = self._create_message(recipient, subject, body, html_body)
-
+        self._slots.acquire()
         try:
-            with smtplib.SMTP(self.email_host, self.email_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                server.login(self.email_user, self.email_password)
-                server.sendmail(self.sender, recipient, message.as_string())
-
-            app_logger.info(f"Email sent successfully to {recipient}")
+            # A pooled connection can be dropped by the server between the NOOP
+            # check and the send, so retry once on a fresh connection
+            for attempt in range(2):
+                server = self._checkout()
+                try:
+                    server.sendmail(self.sender, recipient, message)
+                except smtplib.SMTPServerDisconnected:
+                    self._close(server)
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    self._close(server)
+                    raise
+                self._idle.put((server, time.monotonic()))
+                break
+
+            app_logger.info("Email sent successfully to %s", recipient)
             return True
         except Exception as e:
-            app_logger.error(f"Failed to send email: {str(e)}")
+            app_logger.error("Failed to send email: %s", e)
             return False
+        finally:
+            self._slots.release()
 
     def send_verification_email(self, email: str, verification_token: str) -> bool:
         """
@@ -114,35 +297,9 @@ class EmailService:
             f"{self.frontend_url}/verify-email?token={verification_token}"
         )
 
-        subject = "Verify your email address"
-
-        body = f"""
-        Hello,
-
-        Please verify your email address by clicking on the link below:
-
-        {verification_url}
-
-        If you did not sign up for this account, you can ignore this email.
-
-        Thanks,
-        The PulseCheck Team
-        """
-
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Email Verification</h2>
-            <p>Hello,</p>
-            <p>Please verify your email address by clicking on the link below:</p>
-            <p><a href="{verification_url}">Verify Email</a></p>
-            <p>If you did not sign up for this account, you can ignore this email.</p>
-            <p>Thanks,<br>The PulseCheck Team</p>
-        </body>
-        </html>
-        """
-
-        return self.send_email(email, subject, body, html_body)
+        return self._deliver(
+            email, self._verify_message.substitute(to=email, url=verification_url)
+        )
 
     def send_password_reset_email(self, recipient: str, token: str) -> bool:
         """
@@ -157,24 +314,9 @@ class EmailService:
         """
         reset_url = f"{self.frontend_url}/reset-password?token={token}"
 
-        subject = "Reset Your Password - Team Pulse Check"
-
-        body_html = f"""
-        <html>
-            <body>
-                <h2>Password Reset Request</h2>
-                <p>We received a request to reset your password. Click the link below to create a new password:</p>
-                <p><a href="{reset_url}">Reset Password</a></p>
-                <p>Or copy and paste this URL into your browser:</p>
-                <p>{reset_url}</p>
-                <p>This link will expire in 30 minutes for security reasons.</p>
-                <p>If you did not request a password reset, please ignore this email or contact support if you have concerns.</p>
-                <p>Thanks,<br>The Team Pulse Check Team</p>
-            </body>
-        </html>
-        """
-
-        return self.send_email(recipient, subject, body_html)
+        return self._deliver(
+            recipient, self._reset_message.substitute(to=recipient, url=reset_url)
+        )
 
 
 # Create a singleton instance
@@ -2,22 +2,36 @@
 Team service for handling team-related operations.
 """
 
+import base64
+import os
 import secrets
 import string
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, literal, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import load_only, raiseload
 from sqlalchemy.sql import Insert, Select, Update
 
-from ..db.models import Team, TeamInvitation, User, team_members
+from ..db.models import InvitationStatus, Team, TeamInvitation, User, team_members
 
+# Invite codes are random and unique-indexed; a collision is retried with a new code
+INVITE_CODE_ATTEMPTS = 3
+_INVITE_CODE_ALPHABET = string.ascii_uppercase + string.digits
 
-def create_team(
-    db: Session, creator_id: int, name: str, description: Optional[str] = None
+# Invitation tokens are cut from one urandom read of INVITE_TOKEN_BATCH tokens
+INVITE_TOKEN_BYTES = 32
+INVITE_TOKEN_BATCH = 64
+_invite_token_buf = bytearray()
+# A forked worker must not hand out the same bytes as its parent
+os.register_at_fork(after_in_child=_invite_token_buf.clear)
+
+
+async def create_team(
+    db: AsyncSession, creator_id: int, name: str, description: Optional[str] = None
 ) -> Team:
     """
     Create a new team with the provided user as creator.
@@ -35,45 +49,47 @@ def create_team(
         HTTPException: If the creator doesn't exist or other errors occur
     """
     # Check if creator exists
-    user = db.query(User).filter(User.id == creator_id).first()
+    user = await db.get(User, creator_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Generate a unique invite code
-    invite_code = _generate_invite_code()
-
-    # Create new team
-    team = Team(
-        name=name,
-        description=description,
-        invite_code=invite_code,
-        created_by_id=creator_id,
-    )
-
-    db.add(team)
-    db.flush()
+    # Create new team, letting the unique index on invite_code reject collisions
+    for attempt in range(INVITE_CODE_ATTEMPTS):
+        team = Team(
+            name=name,
+            description=description,
+            invite_code=_generate_invite_code(),
+            created_by_id=creator_id,
+        )
+        db.add(team)
+        try:
+            await db.flush()
+            break
+        except IntegrityError:
+            await db.rollback()
+            if attempt == INVITE_CODE_ATTEMPTS - 1:
+                raise
 
     # Add creator as a team member with 'admin' role
     stmt = team_members.insert().values(
         user_id=creator_id,
         team_id=team.id,
         role="admin",
-        joined_at=func.now(),
         is_active=True,
     )
-    db.execute(stmt)
+    await db.execute(stmt)
 
     # Commit the transaction
-    db.commit()
-    db.refresh(team)
+    await db.commit()
+    await db.refresh(team)
 
     return team
 
 
-def join_team_by_invite_code(
-    db: Session, user_id: int, invite_code: str
+async def join_team_by_invite_code(
+    db: AsyncSession, user_id: int, invite_code: str
 ) -> Tuple[Team, str]:
     """
     Add a user to a team using an invite code.
@@ -90,29 +106,21 @@ def join_team_by_invite_code(
         HTTPException: If user or team doesn't exist, or user is already in the team
     """
     # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
     # Find team by invite code
-    team = db.query(Team).filter(Team.invite_code == invite_code).first()
+    team = await db.scalar(select(Team).where(Team.invite_code == invite_code))
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Invalid invite code"
         )
 
     # Check if user is already in the team
-    member = (
-        db.query(team_members)
-        .filter(
-            and_(team_members.c.user_id == user_id, team_members.c.team_id == team.id)
-        )
-        .first()
-    )
-
-    if member:
+    if await _is_member(db, user_id, team.id, active_only=False):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already a member of this team",
@@ -123,16 +131,15 @@ def join_team_by_invite_code(
         user_id=user_id,
         team_id=team.id,
         role="member",
-        joined_at=func.now(),
         is_active=True,
     )
-    db.execute(stmt)
-    db.commit()
+    await db.execute(stmt)
+    await db.commit()
 
     return team, "member"
 
 
-def get_team_by_id(db: Session, team_id: int) -> Optional[Team]:
+async def get_team_by_id(db: AsyncSession, team_id: int) -> Optional[Team]:
     """
     Get a team by its ID.
 
@@ -143,7 +150,22 @@ def get_team_by_id(db: Session, team_id: int) -> Optional[Team]:
     Returns:
         Optional[Team]: The team if found, None otherwise
     """
-    return db.query(Team).filter(Team.id == team_id).first()
+    return await db.get(Team, team_id)
+
+
+async def is_team_member(db: AsyncSession, user_id: int, team_id: int) -> bool:
+    """
+    Check whether a user is an active member of a team.
+
+    Args:
+        db: Database session
+        user_id: ID of the user
+        team_id: ID of the team
+
+    Returns:
+        bool: True if the user has an active membership in the team
+    """
+    return await _is_member(db, user_id, team_id)
 
 
 class TeamInfo(Dict[str, Any]):
@@ -154,10 +176,13 @@ class TeamInfo(Dict[str, Any]):
     joined_at: datetime
 
 
-def get_user_teams(db: Session, user_id: int) -> List[TeamInfo]:
+async def get_user_teams(db: AsyncSession, user_id: int) -> List[TeamInfo]:
     """
     Get all teams that a user is a member of with role and join date.
 
+    Teams are loaded with only the columns the team listing shows, in the same query
+    as the membership rows.
+
     Args:
         db: Database session
         user_id: ID of the user
@@ -166,13 +191,27 @@ def get_user_teams(db: Session, user_id: int) -> List[TeamInfo]:
         List[TeamInfo]: List of dictionaries containing team information, role, and joined_at date
     """
     results = (
-        db.query(Team, team_members.c.role, team_members.c.joined_at)
-        .join(team_members, team_members.c.team_id == Team.id)
-        .filter(
-            and_(team_members.c.user_id == user_id, team_members.c.is_active == True)
+        await db.execute(
+            select(Team, team_members.c.role, team_members.c.joined_at)
+            .options(
+                load_only(
+                    Team.id,
+                    Team.name,
+                    Team.description,
+                    Team.invite_code,
+                    Team.created_at,
+                    Team.updated_at,
+                ),
+                raiseload("*"),
+            )
+            .join(team_members, team_members.c.team_id == Team.id)
+            .where(
+                and_(
+                    team_members.c.user_id == user_id, team_members.c.is_active == True
+                )
+            )
         )
-        .all()
-    )
+    ).all()
 
     teams: List[TeamInfo] = []
     for team_row, role, joined_at in results:
@@ -190,28 +229,40 @@ class MemberInfo(Dict[str, Any]):
     is_active: bool
 
 
-def get_team_members(db: Session, team_id: int) -> List[MemberInfo]:
+async def get_team_members(
+    db: AsyncSession, team_id: int, active_only: bool = False
+) -> List[MemberInfo]:
     """
     Get all members of a team with their roles and join dates.
 
+    Users are loaded with only their public profile columns, in the same query as
+    the membership rows.
+
     Args:
         db: Database session
         team_id: ID of the team
+        active_only: Whether to skip inactive memberships
 
     Returns:
         List[MemberInfo]: List of dictionaries containing user information, role, and joined_at date
     """
-    results = (
-        db.query(
+    query = (
+        select(
             User,
             team_members.c.role,
             team_members.c.joined_at,
             team_members.c.is_active,
         )
+        .options(
+            load_only(User.id, User.username, User.email, User.full_name),
+            raiseload("*"),
+        )
         .join(team_members, team_members.c.user_id == User.id)
-        .filter(team_members.c.team_id == team_id)
-        .all()
+        .where(team_members.c.team_id == team_id)
     )
+    if active_only:
+        query = query.where(team_members.c.is_active == True)
+    results = (await db.execute(query)).all()
 
     members: List[MemberInfo] = []
     for user_row, role, joined_at, is_active in results:
@@ -229,8 +280,8 @@ def get_team_members(db: Session, team_id: int) -> List[MemberInfo]:
     return members
 
 
-def update_team(
-    db: Session,
+async def update_team(
+    db: AsyncSession,
     team_id: int,
     user_id: int,
     name: Optional[str] = None,
@@ -252,26 +303,13 @@ def update_team(
     Raises:
         HTTPException: If team doesn't exist, or user doesn't have permission
     """
-    # Check if team exists
-    team = db.query(Team).filter(Team.id == team_id).first()
+    # Load the team and the caller's role in one query
+    team, role = await _get_team_and_role(db, team_id, user_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
 
-    # Check if user has permission (team creator or admin)
-    role = (
-        db.query(team_members.c.role)
-        .filter(
-            and_(
-                team_members.c.user_id == user_id,
-                team_members.c.team_id == team_id,
-                team_members.c.is_active == True,
-            )
-        )
-        .scalar()
-    )
-
     if not role or role not in ["admin", "owner"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -284,15 +322,15 @@ def update_team(
     if description is not None:
         team.description = description  # type: ignore
 
-    team.updated_at = datetime.utcnow()  # type: ignore
-    db.commit()
-    db.refresh(team)
+    await db.commit()
+    # Only the server-maintained timestamp changed
+    await db.refresh(team, ["updated_at"])
 
     return team
 
 
-def remove_team_member(
-    db: Session, team_id: int, admin_id: int, member_id: int
+async def remove_team_member(
+    db: AsyncSession, team_id: int, admin_id: int, member_id: int
 ) -> bool:
     """
     Remove a member from a team.
@@ -309,26 +347,13 @@ def remove_team_member(
     Raises:
         HTTPException: If team/user doesn't exist, or requester lacks permission
     """
-    # Check if team exists
-    team = db.query(Team).filter(Team.id == team_id).first()
+    # Load the team and the caller's role in one query
+    team, role = await _get_team_and_role(db, team_id, admin_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
 
-    # Check if admin has permission
-    role = (
-        db.query(team_members.c.role)
-        .filter(
-            and_(
-                team_members.c.user_id == admin_id,
-                team_members.c.team_id == team_id,
-                team_members.c.is_active == True,
-            )
-        )
-        .scalar()
-    )
-
     if not role or role not in ["admin", "owner"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -343,26 +368,14 @@ def remove_team_member(
         )
 
     # Check if the member is part of the team
-    member_record = (
-        db.query(team_members)
-        .filter(
-            and_(
-                team_members.c.user_id == member_id,
-                team_members.c.team_id == team_id,
-                team_members.c.is_active == True,
-            )
-        )
-        .first()
-    )
-
-    if not member_record:
+    if not await _is_member(db, member_id, team_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User is not a member of this team",
         )
 
     # Set member as inactive instead of deleting
-    db.execute(
+    await db.execute(
         team_members.update()
         .where(
             and_(team_members.c.user_id == member_id, team_members.c.team_id == team_id)
@@ -370,12 +383,12 @@ def remove_team_member(
         .values(is_active=False)
     )
 
-    db.commit()
+    await db.commit()
 
     return True
 
 
-def regenerate_invite_code(db: Session, team_id: int, user_id: int) -> str:
+async def regenerate_invite_code(db: AsyncSession, team_id: int, user_id: int) -> str:
     """
     Regenerate the invite code for a team.
 
@@ -390,45 +403,38 @@ def regenerate_invite_code(db: Session, team_id: int, user_id: int) -> str:
     Raises:
         HTTPException: If team doesn't exist, or user doesn't have permission
     """
-    # Check if team exists
-    team = db.query(Team).filter(Team.id == team_id).first()
+    # Load the team and the caller's role in one query
+    team, role = await _get_team_and_role(db, team_id, user_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
 
-    # Check if user has permission
-    role = (
-        db.query(team_members.c.role)
-        .filter(
-            and_(
-                team_members.c.user_id == user_id,
-                team_members.c.team_id == team_id,
-                team_members.c.is_active == True,
-            )
-        )
-        .scalar()
-    )
-
     if not role or role not in ["admin", "owner"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to regenerate the invite code",
         )
 
-    # Generate new invite code
-    new_code = _generate_invite_code()
-    team.invite_code = new_code  # type: ignore
-    team.updated_at = datetime.utcnow()  # type: ignore
-
-    db.commit()
-    db.refresh(team)
+    # Store a new invite code, letting the unique index reject collisions
+    for attempt in range(INVITE_CODE_ATTEMPTS):
+        new_code = _generate_invite_code()
+        try:
+            await db.execute(
+                update(Team).where(Team.id == team_id).values(invite_code=new_code)
+            )
+            await db.commit()
+            break
+        except IntegrityError:
+            await db.rollback()
+            if attempt == INVITE_CODE_ATTEMPTS - 1:
+                raise
 
     return new_code
 
 
-def create_team_invitation(
-    db: Session,
+async def create_team_invitation(
+    db: AsyncSession,
     team_id: int,
     inviter_id: int,
     invitee_email: str,
@@ -452,26 +458,13 @@ def create_team_invitation(
     Raises:
         HTTPException: If team/user doesn't exist, or inviter lacks permission
     """
-    # Check if team exists
-    team = db.query(Team).filter(Team.id == team_id).first()
+    # Load the team and the caller's role in one query
+    team, role = await _get_team_and_role(db, team_id, inviter_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team not found"
         )
 
-    # Check if inviter is part of the team and has permission
-    role = (
-        db.query(team_members.c.role)
-        .filter(
-            and_(
-                team_members.c.user_id == inviter_id,
-                team_members.c.team_id == team_id,
-                team_members.c.is_active == True,
-            )
-        )
-        .scalar()
-    )
-
     if not role:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -479,32 +472,18 @@ def create_team_invitation(
         )
 
     # Check if invitee is already a member of the team
-    if invitee_id:
-        member = (
-            db.query(team_members)
-            .filter(
-                and_(
-                    team_members.c.user_id == invitee_id,
-                    team_members.c.team_id == team_id,
-                    team_members.c.is_active == True,
-                )
-            )
-            .first()
+    if invitee_id and await _is_member(db, invitee_id, team_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User is already a member of this team",
         )
 
-        if member:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User is already a member of this team",
-            )
-
     # Check if there's an active invitation for this user/email
-    existing_invitation = (
-        db.query(TeamInvitation)
-        .filter(
+    existing_invitation = await db.scalar(
+        select(TeamInvitation).where(
             and_(
                 TeamInvitation.team_id == team_id,
-                TeamInvitation.status == "pending",
+                TeamInvitation.status == InvitationStatus.PENDING,
                 (
                     TeamInvitation.invitee_id == invitee_id
                     if invitee_id
@@ -512,7 +491,6 @@ def create_team_invitation(
                 ),
             )
         )
-        .first()
     )
 
     if existing_invitation:
@@ -520,8 +498,8 @@ def create_team_invitation(
         return existing_invitation
 
     # Generate invitation token
-    token = secrets.token_urlsafe(32)
-    expires_at = datetime.utcnow() + timedelta(days=expiration_days)
+    token = _invite_token()
+    expires_at = datetime.now(timezone.utc) + timedelta(days=expiration_days)
 
     # Create invitation
     invitation = TeamInvitation(
@@ -529,18 +507,92 @@ def create_team_invitation(
         inviter_id=inviter_id,
         invitee_id=invitee_id,
         invitee_email=invitee_email,
-        status="pending",
+        status=InvitationStatus.PENDING,
         token=token,
         expires_at=expires_at,
     )
 
     db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
+    await db.commit()
+    await db.refresh(invitation)
 
     return invitation
 
 
+async def _get_team_and_role(
+    db: AsyncSession, team_id: int, user_id: int
+) -> Tuple[Optional[Team], Optional[str]]:
+    """
+    Get a team together with a user's active role in it.
+
+    Args:
+        db: Database session
+        team_id: ID of the team
+        user_id: ID of the user
+
+    Returns:
+        Tuple[Optional[Team], Optional[str]]: The team, or None if it doesn't exist,
+        and the user's role, or None if they are not an active member
+    """
+    row = (
+        await db.execute(
+            select(Team, team_members.c.role)
+            .outerjoin(
+                team_members,
+                and_(
+                    team_members.c.team_id == Team.id,
+                    team_members.c.user_id == user_id,
+                    team_members.c.is_active == True,
+                ),
+            )
+            .where(Team.id == team_id)
+        )
+    ).first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+async def _is_member(
+    db: AsyncSession, user_id: int, team_id: int, active_only: bool = True
+) -> bool:
+    """
+    Check for a membership row without loading it.
+
+    Args:
+        db: Database session
+        user_id: ID of the user
+        team_id: ID of the team
+        active_only: Ignore memberships that have been deactivated
+
+    Returns:
+        bool: True if a matching membership exists
+    """
+    condition = and_(
+        team_members.c.user_id == user_id, team_members.c.team_id == team_id
+    )
+    if active_only:
+        condition = and_(condition, team_members.c.is_active == True)
+    found = await db.scalar(select(literal(1)).where(condition).limit(1))
+    return found is not None
+
+
+def _invite_token() -> str:
+    """
+    Generate an invitation token.
+
+    Tokens have the same format as secrets.token_urlsafe(INVITE_TOKEN_BYTES).
+
+    Returns:
+        str: URL-safe base64 token without padding
+    """
+    if len(_invite_token_buf) < INVITE_TOKEN_BYTES:
+        _invite_token_buf.extend(os.urandom(INVITE_TOKEN_BYTES * INVITE_TOKEN_BATCH))
+    raw = bytes(_invite_token_buf[:INVITE_TOKEN_BYTES])
+    del _invite_token_buf[:INVITE_TOKEN_BYTES]
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
 def _generate_invite_code(length: int = 8) -> str:
     """
     Generate a random invite code.
@@ -551,5 +603,11 @@ def _generate_invite_code(length: int = 8) -> str:
     Returns:
         str: The generated invite code
     """
-    chars = string.ascii_uppercase + string.digits
-    return "".join(secrets.choice(chars) for _ in range(length))
+    # One CSPRNG draw over every possible code, written out in base 36
+    alphabet = _INVITE_CODE_ALPHABET
+    value = secrets.randbelow(len(alphabet) ** length)
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, len(alphabet))
+        chars.append(alphabet[index])
+    return "".join(chars)
@@ -3,6 +3,8 @@ Environment variables configuration for the game ratings service.
 """
 
 # mypy: ignore-errors
+from functools import cached_property, lru_cache
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +23,11 @@ class Settings(BaseSettings):
     MYSQL_USER: str
     MYSQL_ROOT_PASSWORD: SecretStr
     MYSQL_DB_NAME: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # Below MySQL's default wait_timeout
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_PRE_PING: bool = True  # Ping connections on checkout to drop dead ones
     PROTOCOL: str = "https"  # Default to HTTPS for security
     LOG_LEVEL: str = (
         "INFO"  # Default to INFO for development change to ERROR for production
@@ -30,35 +37,63 @@ class Settings(BaseSettings):
     AUTH_EMAIL_HOST_USER: str
     AUTH_EMAIL_HOST_PASSWORD: SecretStr
     AUTH_EMAIL_USE_TLS: bool = True
+    SMTP_POOL_SIZE: int = 2  # Maximum open SMTP connections per worker
     SECRET_KEY: SecretStr
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: int = (
+        10  # OWASP minimum; hashes at other costs are upgraded on login
+    )
+    BCRYPT_AUTO_TUNE: bool = False  # Raise BCRYPT_ROUNDS at startup to hit the target
+    BCRYPT_TARGET_MS: int = 250  # Per-hash time the auto-tune aims for
     EMAIL_VERIFICATION_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    EMAIL_SEND_LIMIT_PER_MINUTE: int = 3  # Per address, for verification and reset
 
-    @property
+    @cached_property
     def DB_URL(self) -> str:
         """Get formatted database URL."""
         password = self.MYSQL_ROOT_PASSWORD.get_secret_value()
         return f"mysql+pymysql://{self.MYSQL_USER}:{password}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DB_NAME}"
 
-    @property
+    @cached_property
+    def ASYNC_DB_URL(self) -> str:
+        """Get formatted database URL for the async (aiomysql) driver."""
+        password = self.MYSQL_ROOT_PASSWORD.get_secret_value()
+        return f"mysql+aiomysql://{self.MYSQL_USER}:{password}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DB_NAME}"
+
+    @cached_property
     def API_TOKEN_VALUE(self) -> str:
         """Get API token value."""
         return self.API_TOKEN.get_secret_value()
 
-    @property
+    @cached_property
     def AUTH_EMAIL_HOST_PASSWORD_VALUE(self) -> str:
         """Get email host password value."""
         return self.AUTH_EMAIL_HOST_PASSWORD.get_secret_value()
 
-    @property
+    @cached_property
     def SECRET_KEY_VALUE(self) -> str:
         """Get secret key value."""
         return self.SECRET_KEY.get_secret_value()
 
+    # Read once at import; frozen so the derived values below can be cached
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="allow"
+        env_file=".env", env_file_encoding="utf-8", extra="allow", frozen=True
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the validated application settings.
+
+    The environment is parsed on the first call only; use get_settings.cache_clear()
+    to reload it.
+
+    Returns:
+        Settings: The shared settings instance
+    """
+    return Settings()
+
+
 # Create a singleton instance
-app_settings = Settings()
+app_settings = get_settings()
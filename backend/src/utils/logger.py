@@ -2,33 +2,39 @@
 Logger configuration for the application.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import List, Optional
 
 from .config import app_settings
 
+_LOG_FORMAT = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
 
-def configure_logger(name: str) -> logging.Logger:
-    """
-    Creates and configures a logger with appropriate handlers based on environment.
+# Handlers shared by every logger from configure_logger, see _get_handlers
+_shared_handlers: Optional[List[logging.Handler]] = None
+
+
+def _get_handlers() -> List[logging.Handler]:
     """
-    log_level = app_settings.LOG_LEVEL
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    logger_format = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
+    Get the handlers shared by every configured logger.
 
-    if not logger.hasHandlers():
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logger_format)
+    Created on first use, so each process opens the log file once no matter how
+    many loggers are configured.
+
+    Returns:
+        List[logging.Handler]: A queue handler feeding the file handler on a
+        background thread, outside test and production, and the console handler
+    """
+    global _shared_handlers
+    if _shared_handlers is None:
+        handlers: List[logging.Handler] = []
 
-        if app_settings.CURRENT_ENV in ("test", "production"):
-            console_handler.setLevel(log_level)
-        else:
+        if app_settings.CURRENT_ENV not in ("test", "production"):
             # Create logs directory if it doesn't exist
             logs_dir = Path(os.getcwd()) / "logs"
             logs_dir.mkdir(exist_ok=True)
@@ -37,12 +43,41 @@ def configure_logger(name: str) -> logging.Logger:
             file_handler = TimedRotatingFileHandler(
                 log_file, when="midnight", interval=1, backupCount=7
             )
-            console_handler.setLevel(log_level)
-            file_handler.setFormatter(logger_format)
+            file_handler.setFormatter(_LOG_FORMAT)
             file_handler.setLevel(logging.WARNING)
-            logger.addHandler(file_handler)
 
-        logger.addHandler(console_handler)
+            # Writes and rollovers happen on the listener thread, so callers only
+            # pay for a queue put
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+            listener = QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(logging.WARNING)
+            handlers.append(queue_handler)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_LOG_FORMAT)
+        console_handler.setLevel(app_settings.LOG_LEVEL)
+        handlers.append(console_handler)
+
+        _shared_handlers = handlers
+    return _shared_handlers
+
+
+def configure_logger(name: str) -> logging.Logger:
+    """
+    Creates and configures a logger with appropriate handlers based on environment.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(app_settings.LOG_LEVEL)
+
+    if not logger.hasHandlers():
+        for handler in _get_handlers():
+            logger.addHandler(handler)
 
     return logger
 